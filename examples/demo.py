@@ -8,7 +8,7 @@ Run it from any directory to see FileFinder in action.
 
 from pathlib import Path
 
-from file_finder import Condition, FileFinder
+from file_finder import Condition, FileFinder, FileInfo
 
 
 def print_section(title):
@@ -19,7 +19,7 @@ def print_section(title):
 
 
 def print_results(results, max_display=10):
-    """Print search results with a limit."""
+    """Print search results (FileInfo records or plain paths) with a limit."""
     results_list = list(results) if not isinstance(results, list) else results
     
     if not results_list:
@@ -27,8 +27,17 @@ def print_results(results, max_display=10):
         return
     
     print(f"  Found {len(results_list)} file(s):")
-    for i, path in enumerate(results_list[:max_display], 1):
-        size = path.stat().st_size if path.exists() else 0
+    for i, result in enumerate(results_list[:max_display], 1):
+        if isinstance(result, FileInfo):
+            # The size comes from the stat the search already made, so no syscall here
+            path, size = result.path, result.size
+        else:
+            # One stat instead of exists() + stat(); the file may be gone since the search
+            path = result
+            try:
+                size = path.stat().st_size
+            except OSError:
+                size = 0
         size_str = f"{size:,} bytes"
         if size > 1024 * 1024:
             size_str = f"{size / (1024 * 1024):.2f} MB"
@@ -54,32 +63,34 @@ def main():
     
     # Demo 1: Find all Python files
     print_section("Demo 1: All Python Files")
-    results = finder.search(Condition.extension('.py'))
+    results = finder.search(Condition.extension('.py'), with_stat=True)
     print_results(results)
     
     # Demo 2: Find Python files in current directory only (not subdirs)
     print_section("Demo 2: Python Files (Current Directory Only)")
     results = finder.search(
         Condition.extension('.py'),
-        recursive=False
+        recursive=False,
+        with_stat=True
     )
     print_results(results)
     
     # Demo 3: Find all image files
     print_section("Demo 3: All Image Files")
-    results = finder.search(Condition.is_image())
+    results = finder.search(Condition.is_image(), with_stat=True)
     print_results(results)
     
     # Demo 4: Find files with specific name
     print_section("Demo 4: Files Named 'README.md'")
-    results = finder.search(Condition.name_equals('README.md'))
+    results = finder.search(Condition.name_equals('README.md'), with_stat=True)
     print_results(results)
     
     # Demo 5: Complex query - Python files modified recently
     print_section("Demo 5: Python Files Modified in Last 7 Days")
     results = finder.search(
         Condition.extension('.py')
-        .AND(Condition.modified_within_days(7))
+        .AND(Condition.modified_within_days(7)),
+        with_stat=True
     )
     print_results(results)
     
@@ -87,13 +98,14 @@ def main():
     print_section("Demo 6: Files with 'demo' OR 'test' in Name")
     results = finder.search(
         Condition.name_contains('demo')
-        .OR(Condition.name_contains('test'))
+        .OR(Condition.name_contains('test')),
+        with_stat=True
     )
     print_results(results)
     
     # Demo 7: Large files (> 1MB)
     print_section("Demo 7: Files Larger Than 1MB")
-    results = finder.search(Condition.size_greater_than(1 * 1024 * 1024))
+    results = finder.search(Condition.size_greater_than(1 * 1024 * 1024), with_stat=True)
     print_results(results)
     
     # Demo 8: Complex query - Your original example
@@ -103,7 +115,8 @@ def main():
     results = finder.search(
         Condition.extension('.md', '.py')
         .AND(Condition.size_between(100, 100 * 1024))
-        .OR(Condition.is_image())
+        .OR(Condition.is_image()),
+        with_stat=True
     )
     print_results(results)
     
@@ -123,7 +136,7 @@ def main():
     # Demo 10: Regex pattern matching
     print_section("Demo 10: Files Matching Regex Pattern")
     print("  Pattern: Files starting with 'file' or 'demo'")
-    results = finder.search(Condition.name_matches(r'^(file|demo).*'))
+    results = finder.search(Condition.name_matches(r'^(file|demo).*'), with_stat=True)
     print_results(results)
     
     # Demo 11: Exclude directories
@@ -131,18 +144,19 @@ def main():
     print("  Excluding: __pycache__, .git, node_modules")
     results = finder.search(
         Condition.extension('.py')
-        .AND(Condition.not_in_directory('__pycache__', '.git', 'node_modules'))
+        .AND(Condition.not_in_directory('__pycache__', '.git', 'node_modules')),
+        with_stat=True
     )
     print_results(results)
     
     # Demo 12: Type detection helpers
     print_section("Demo 12: Type Detection Helpers")
     print("\n  Documents:")
-    docs = finder.search(Condition.is_document())
+    docs = finder.search(Condition.is_document(), with_stat=True)
     print_results(docs, max_display=5)
     
     print("\n  Archives:")
-    archives = finder.search(Condition.is_archive())
+    archives = finder.search(Condition.is_archive(), with_stat=True)
     print_results(archives, max_display=5)
     
     print("\n" + "=" * 60)
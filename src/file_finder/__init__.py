@@ -6,7 +6,7 @@ such as extension, size, location, name patterns, and modification time.
 """
 
 from file_finder.config import config, get_logger
-from file_finder.core import Condition, ConditionOperator, FileFinder
+from file_finder.core import Condition, ConditionOperator, FileFinder, FileInfo
 
 __version__ = "0.1.0"
-__all__ = ["Condition", "ConditionOperator", "FileFinder", "config", "get_logger"]
+__all__ = ["Condition", "ConditionOperator", "FileFinder", "FileInfo", "config", "get_logger"]
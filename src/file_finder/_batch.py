@@ -0,0 +1,137 @@
+"""
+Structure-of-arrays candidate batches for FileFinder's ``batch_mode``.
+
+Stat fields of a batch of candidates are gathered into NumPy columns so size
+and time conditions compare every row at once. NumPy is an optional
+dependency (the ``batch`` extra); without it, ``AVAILABLE`` is False and
+searches evaluate candidates one at a time.
+"""
+
+import os
+from collections.abc import Callable, Sequence
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the extra
+    np = None
+
+if TYPE_CHECKING:
+    from file_finder.core import _CandidateCtx
+
+AVAILABLE = np is not None
+
+DEFAULT_BATCH_SIZE = 4096
+
+# Stat field holding a file's creation time: the real birth time where the platform
+# reports one (macOS, BSD, Windows), otherwise the inode change time
+CREATION_TIME_FIELD = "st_birthtime" if hasattr(os.stat_result, "st_birthtime") else "st_ctime"
+
+
+class CandidateBatch:
+    """
+    A batch of candidates with their stat fields as parallel arrays.
+
+    Only the rows passed to load_stats are stat'ed, each at most once, so
+    rows already rejected by earlier operands are never stat'ed. Each column
+    is only built when a condition reads it. Each candidate's context caches
+    its stat result, so predicates that fall back to per-row evaluation
+    reuse it.
+    """
+
+    __slots__ = ("_columns", "_loaded", "_stats", "ctxs", "names")
+
+    def __init__(self, ctxs: Sequence["_CandidateCtx"]):
+        self.ctxs = ctxs
+        self.names = [ctx.name for ctx in ctxs]
+        self._stats: list[os.stat_result | None] = [None] * len(ctxs)
+        self._loaded = np.zeros(len(ctxs), dtype=bool)
+        self._columns: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.ctxs)
+
+    @property
+    def stat_ok(self) -> "np.ndarray":
+        """Boolean column, False where the candidate was not or could not be stat'ed."""
+        column = self._columns.get("stat_ok")
+        if column is None:
+            stats = self._stats
+            column = np.fromiter((st is not None for st in stats), bool, len(stats))
+            self._columns["stat_ok"] = column
+        return column
+
+    @property
+    def sizes(self) -> "np.ndarray":
+        """File sizes in bytes (0 where stat failed)."""
+        return self._column("st_size", np.int64)
+
+    @property
+    def mtimes(self) -> "np.ndarray":
+        """Modification times as POSIX timestamps (0 where stat failed)."""
+        return self._column("st_mtime", np.float64)
+
+    @property
+    def ctimes(self) -> "np.ndarray":
+        """Creation times (see CREATION_TIME_FIELD) as POSIX timestamps."""
+        return self._column(CREATION_TIME_FIELD, np.float64)
+
+    def load_stats(self, rows: "np.ndarray") -> None:
+        """
+        Stat the selected rows that have not been stat'ed yet.
+
+        Columns already built are updated in place for the newly stat'ed rows.
+
+        Args:
+            rows: Boolean mask of rows whose stat fields are needed
+        """
+        pending = np.flatnonzero(rows & ~self._loaded)
+        if not pending.size:
+            return
+        stats = self._stats
+        ctxs = self.ctxs
+        for i in pending:
+            # Rows that cannot be stat'ed keep None and so never match
+            with suppress(OSError):
+                stats[i] = ctxs[i].stat()
+        self._loaded[pending] = True
+        for attr, column in self._columns.items():
+            if attr == "stat_ok":
+                column[pending] = [stats[i] is not None for i in pending]
+            else:
+                column[pending] = [getattr(stats[i], attr) if stats[i] else 0 for i in pending]
+
+    def all_rows(self) -> "np.ndarray":
+        """Return a mask selecting every row of the batch."""
+        return np.ones(len(self.ctxs), dtype=bool)
+
+    def evaluate_rows(
+        self, match: Callable[["_CandidateCtx"], bool], rows: "np.ndarray"
+    ) -> "np.ndarray":
+        """
+        Evaluate a per-candidate predicate on the selected rows only.
+
+        Args:
+            match: Predicate taking a candidate context
+            rows: Boolean mask of rows to evaluate
+
+        Returns:
+            Boolean column, False for rows that were not selected
+        """
+        result = np.zeros(len(self.ctxs), dtype=bool)
+        ctxs = self.ctxs
+        for i in np.flatnonzero(rows):
+            result[i] = match(ctxs[i])
+        return result
+
+    def _column(self, attr: str, dtype: type) -> "np.ndarray":
+        """Build (once) the column holding one stat field of every candidate."""
+        column = self._columns.get(attr)
+        if column is None:
+            stats = self._stats
+            column = np.fromiter(
+                (getattr(st, attr) if st else 0 for st in stats), dtype, len(stats)
+            )
+            self._columns[attr] = column
+        return column
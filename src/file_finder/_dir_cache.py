@@ -0,0 +1,160 @@
+"""
+Process-wide cache of decoded directory listings for repeated searches.
+
+Each listing is keyed by directory path and validated against the directory's
+``st_mtime_ns``/``st_ino`` before reuse, so adding, removing or renaming an
+entry invalidates it. Only names, types and inode numbers are cached: a file
+modified in place does not touch its directory's mtime, so sizes and times are
+always stat'ed fresh. Each entry also records a bitmap of the letters in its
+name, which lets repeated name searches reject most files without scanning
+the name at all.
+"""
+
+import os
+import stat
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+
+from file_finder.config import config
+
+
+def letter_mask(text: str) -> int:
+    """
+    Return a 26-bit bitmap of the ASCII letters in ``text``, ignoring case.
+
+    If a name contains a string, its mask covers the string's mask, so
+    ``mask & required != required`` proves a name cannot match.
+    """
+    mask = 0
+    for char in set(text.lower()):
+        if "a" <= char <= "z":
+            mask |= 1 << (ord(char) - 97)
+    return mask
+
+
+class CachedEntry:
+    """DirEntry-compatible record of one directory entry held in the cache."""
+
+    __slots__ = ("_inode", "_is_dir", "_is_file", "_is_symlink", "letter_mask", "name", "path")
+
+    def __init__(self, entry: os.DirEntry):
+        self.name = entry.name
+        self.path = entry.path
+        self._is_symlink = entry.is_symlink()
+        self._is_dir = entry.is_dir(follow_symlinks=False)
+        self._is_file = entry.is_file(follow_symlinks=False)
+        self._inode = entry.inode()
+        self.letter_mask = letter_mask(entry.name)
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return f"<CachedEntry {self.name!r}>"
+
+    def inode(self) -> int:
+        """Return the inode number recorded when the directory was scanned."""
+        return self._inode
+
+    def is_symlink(self) -> bool:
+        """Return True if the entry is a symbolic link."""
+        return self._is_symlink
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        """Return True if the entry is a directory (or a link to one when following)."""
+        if follow_symlinks and self._is_symlink:
+            return self._target_mode_is(stat.S_ISDIR)
+        return self._is_dir
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        """Return True if the entry is a regular file (or a link to one when following)."""
+        if follow_symlinks and self._is_symlink:
+            return self._target_mode_is(stat.S_ISREG)
+        return self._is_file
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        """Stat the entry; never cached, since file contents can change in place."""
+        return Path(self.path).stat(follow_symlinks=follow_symlinks)
+
+    def _target_mode_is(self, test: Callable[[int], bool]) -> bool:
+        # A link target can change without touching the directory, so resolve it live
+        try:
+            return test(self.stat().st_mode)
+        except OSError:
+            return False
+
+
+class DirCache:
+    """Thread-safe LRU cache mapping directory paths to their decoded listings."""
+
+    def __init__(self, max_size: int):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of directory listings to keep
+        """
+        self.max_size = max_size
+        self.root: str | None = None
+        self._listings: OrderedDict[str, tuple[int, int, tuple[CachedEntry, ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def clear(self) -> None:
+        """Drop every cached listing."""
+        with self._lock:
+            self._listings.clear()
+
+    def set_root(self, root: str) -> None:
+        """Clear the cache when a search starts from a different root than before."""
+        if root != self.root:
+            self.clear()
+            self.root = root
+
+    def scandir(
+        self,
+        path: str | os.PathLike[str],
+        scandir: Callable[[str], AbstractContextManager[Iterator[os.DirEntry]]] = os.scandir,
+    ) -> AbstractContextManager[tuple[CachedEntry, ...]]:
+        """
+        Return the entries of a directory, from the cache when it is still valid.
+
+        Usable as a drop-in for ``os.scandir`` inside a ``with`` statement.
+
+        Args:
+            path: Directory to list
+            scandir: Function used to read the directory on a cache miss
+
+        Raises:
+            OSError: If the directory cannot be stat'ed or read
+        """
+        key = os.fspath(path)
+        dir_stat = Path(key).stat()
+
+        with self._lock:
+            cached = self._listings.get(key)
+            if cached is not None:
+                mtime_ns, inode, entries = cached
+                if mtime_ns == dir_stat.st_mtime_ns and inode == dir_stat.st_ino:
+                    self._listings.move_to_end(key)
+                    return nullcontext(entries)
+
+        with scandir(key) as it:
+            entries = tuple(CachedEntry(entry) for entry in it)
+
+        with self._lock:
+            self._listings[key] = (dir_stat.st_mtime_ns, dir_stat.st_ino, entries)
+            self._listings.move_to_end(key)
+            while len(self._listings) > self.max_size:
+                self._listings.popitem(last=False)
+
+        return nullcontext(entries)
+
+
+# Global cache shared by every FileFinder with caching enabled
+dir_cache = DirCache(config.cache_size)
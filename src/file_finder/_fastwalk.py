@@ -0,0 +1,215 @@
+"""
+Linux getdents64 directory reader used by FileFinder's "getdents" backend.
+
+Reads raw ``linux_dirent64`` records into a 32KB buffer with a direct syscall
+and exposes them through a small ``os.scandir``-compatible interface, so the
+walker and conditions can use either backend interchangeably.
+"""
+
+import ctypes
+import os
+import platform
+import stat
+import struct
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+# getdents64 syscall numbers by machine architecture and pointer size in bytes. The
+# machine name describes the kernel, so the interpreter's own pointer size picks the
+# ABI: a 32-bit Python on a 64-bit kernel (or x32) matches no entry and goes unsupported
+_SYS_GETDENTS64 = {
+    ("x86_64", 8): 217,
+    ("amd64", 8): 217,
+    ("aarch64", 8): 61,
+    ("arm64", 8): 61,
+    ("riscv64", 8): 61,
+    ("ppc64", 8): 202,
+    ("ppc64le", 8): 202,
+    ("s390x", 8): 220,
+    ("i386", 4): 220,
+    ("i686", 4): 220,
+    ("armv7l", 4): 217,
+}
+
+BUFFER_SIZE = 32768
+
+# d_type values from <dirent.h>
+DT_UNKNOWN = 0
+DT_DIR = 4
+DT_REG = 8
+DT_LNK = 10
+
+# linux_dirent64 header: d_ino (u64), d_off (s64), d_reclen (u16), d_type (u8)
+_HEADER = struct.Struct("=QqHB")
+
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_CLOEXEC", 0)
+_O_NOFOLLOW = getattr(os, "O_NOFOLLOW", 0)
+
+
+def _load_syscall() -> tuple[int, Callable] | None:
+    """Bind libc's syscall() for getdents64, or return None if unsupported."""
+    if not sys.platform.startswith("linux"):
+        return None
+    number = _SYS_GETDENTS64.get((platform.machine().lower(), struct.calcsize("P")))
+    if number is None:
+        return None
+    try:
+        syscall = ctypes.CDLL(None, use_errno=True).syscall
+    except (OSError, AttributeError):
+        return None
+    syscall.restype = ctypes.c_long
+    syscall.argtypes = [ctypes.c_long, ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t]
+    return number, syscall
+
+
+_syscall = _load_syscall()
+
+AVAILABLE = _syscall is not None
+
+
+def read_dir(fd: int) -> Iterator[tuple[int, int, bytes]]:
+    """
+    Read raw entries from an open directory file descriptor.
+
+    Args:
+        fd: File descriptor opened with O_DIRECTORY
+
+    Yields:
+        (d_type, d_ino, name) tuples, skipping '.' and '..'
+    """
+    number, syscall = _syscall
+    buffer = ctypes.create_string_buffer(BUFFER_SIZE)
+    unpack_from = _HEADER.unpack_from
+    header_size = _HEADER.size
+
+    while True:
+        nread = syscall(number, fd, buffer, BUFFER_SIZE)
+        if nread < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        if nread == 0:
+            return
+
+        data = ctypes.string_at(buffer, nread)
+        pos = 0
+        while pos < nread:
+            d_ino, _d_off, reclen, d_type = unpack_from(data, pos)
+            name_start = pos + header_size
+            name = data[name_start : data.index(b"\0", name_start, pos + reclen)]
+            pos += reclen
+            if name in (b".", b".."):
+                continue
+            yield d_type, d_ino, name
+
+
+class RawEntry:
+    """
+    DirEntry-compatible view of a getdents64 record.
+
+    Type checks are answered from d_type without a syscall; stat() uses
+    fstatat() against the parent directory's descriptor while it is open and
+    caches the result, like ``os.DirEntry``.
+    """
+
+    __slots__ = ("_d_type", "_ino", "_lstat", "_scan", "_stat", "name", "path")
+
+    def __init__(self, scan: "RawScandir", name: str, d_type: int, ino: int):
+        self._scan = scan
+        self._d_type = d_type
+        self._ino = ino
+        self._stat: os.stat_result | None = None
+        self._lstat: os.stat_result | None = None
+        self.name = name
+        self.path = scan.prefix + name
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return f"<RawEntry {self.name!r}>"
+
+    def inode(self) -> int:
+        """Return the inode number reported by getdents64."""
+        return self._ino
+
+    def is_symlink(self) -> bool:
+        """Return True if the entry is a symbolic link."""
+        if self._d_type == DT_UNKNOWN:
+            return stat.S_ISLNK(self.stat(follow_symlinks=False).st_mode)
+        return self._d_type == DT_LNK
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        """Return True if the entry is a directory (or a link to one when following)."""
+        return self._test_mode(stat.S_ISDIR, DT_DIR, follow_symlinks)
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        """Return True if the entry is a regular file (or a link to one when following)."""
+        return self._test_mode(stat.S_ISREG, DT_REG, follow_symlinks)
+
+    def _test_mode(self, test: Callable[[int], bool], d_type: int, follow_symlinks: bool) -> bool:
+        if self._d_type == DT_UNKNOWN or (follow_symlinks and self._d_type == DT_LNK):
+            try:
+                return test(self.stat(follow_symlinks=follow_symlinks).st_mode)
+            except FileNotFoundError:
+                return False
+        return self._d_type == d_type
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        """Return the (cached) stat result for this entry."""
+        if not follow_symlinks or self._d_type not in (DT_LNK, DT_UNKNOWN):
+            if self._lstat is None:
+                self._lstat = self._scan.stat(self.name, self.path, follow_symlinks=False)
+            if not follow_symlinks or not stat.S_ISLNK(self._lstat.st_mode):
+                return self._lstat
+        if self._stat is None:
+            self._stat = self._scan.stat(self.name, self.path, follow_symlinks=True)
+        return self._stat
+
+
+class RawScandir:
+    """Context-managed iterator over a directory, mirroring ``os.scandir``."""
+
+    def __init__(self, path: str | os.PathLike[str], follow_symlinks: bool = True):
+        self.path = os.fspath(path)
+        self.prefix = self.path if self.path.endswith(os.sep) else self.path + os.sep
+        flags = _OPEN_FLAGS if follow_symlinks else _OPEN_FLAGS | _O_NOFOLLOW
+        self._fd = os.open(self.path, flags)
+
+    def __enter__(self) -> "RawScandir":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[RawEntry]:
+        fsdecode = os.fsdecode
+        for d_type, ino, name in read_dir(self._fd):
+            yield RawEntry(self, fsdecode(name), d_type, ino)
+
+    def stat(self, name: str, path: str, follow_symlinks: bool) -> os.stat_result:
+        """Stat a child entry, relative to the directory descriptor while it is open."""
+        if self._fd >= 0:
+            return os.stat(name, dir_fd=self._fd, follow_symlinks=follow_symlinks)
+        return Path(path).stat(follow_symlinks=follow_symlinks)
+
+    def close(self) -> None:
+        """Close the directory descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def scandir(path: str | os.PathLike[str], *, follow_symlinks: bool = True) -> RawScandir:
+    """
+    Open a directory for raw getdents64 iteration, like ``os.scandir``.
+
+    Args:
+        path: Directory to list
+        follow_symlinks: If False, open with O_NOFOLLOW so that a symlink (for
+            example a directory replaced by one after it was listed) is refused
+
+    Raises:
+        OSError: If the directory cannot be opened (ELOOP for a refused symlink)
+    """
+    return RawScandir(path, follow_symlinks)
@@ -2,54 +2,93 @@
 
 import logging
 import os
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-# Load environment variables from .env file if it exists
-load_dotenv()
+# Load environment variables from a .env file in the working directory, if there is one;
+# checking for it directly avoids load_dotenv's search up the directory tree on every import
+if Path(".env").is_file():
+    load_dotenv(".env")
 
 
+def _get_int_env(key: str) -> int | None:
+    """Get integer value from environment variable."""
+    value = os.getenv(key)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _get_bool_env(key: str) -> bool:
+    """Get a boolean flag from an environment variable ("true", any case)."""
+    return os.getenv(key, "false").lower() == "true"
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Configuration class for FileFinder."""
+    """
+    Configuration for FileFinder, read from environment variables.
+
+    Instances are immutable; build a new one with ``Config.from_env()`` (or
+    ``dataclasses.replace``) instead of changing settings in place.
+    """
 
-    def __init__(self):
-        """Initialize configuration from environment variables."""
-        # Logging configuration
-        self.log_level: str = os.getenv("FILE_FINDER_LOG_LEVEL", "INFO")
-        self.log_format: str = os.getenv(
+    # Logging configuration
+    log_level: str = field(default_factory=partial(os.getenv, "FILE_FINDER_LOG_LEVEL", "INFO"))
+    log_format: str = field(
+        default_factory=partial(
+            os.getenv,
             "FILE_FINDER_LOG_FORMAT",
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         )
-        self.log_file: str | None = os.getenv("FILE_FINDER_LOG_FILE")
-
-        # Search configuration
-        self.default_follow_symlinks: bool = (
-            os.getenv("FILE_FINDER_FOLLOW_SYMLINKS", "false").lower() == "true"
-        )
-        self.default_max_depth: int | None = self._get_int_env("FILE_FINDER_MAX_DEPTH")
-        self.default_max_results: int | None = self._get_int_env("FILE_FINDER_MAX_RESULTS")
-
-        # Performance configuration
-        self.enable_caching: bool = (
-            os.getenv("FILE_FINDER_ENABLE_CACHING", "false").lower() == "true"
+    )
+    log_file: str | None = field(default_factory=partial(os.getenv, "FILE_FINDER_LOG_FILE"))
+
+    # Search configuration
+    default_follow_symlinks: bool = field(
+        default_factory=partial(_get_bool_env, "FILE_FINDER_FOLLOW_SYMLINKS")
+    )
+    default_max_depth: int | None = field(
+        default_factory=partial(_get_int_env, "FILE_FINDER_MAX_DEPTH")
+    )
+    default_max_results: int | None = field(
+        default_factory=partial(_get_int_env, "FILE_FINDER_MAX_RESULTS")
+    )
+
+    # Performance configuration
+    enable_caching: bool = field(
+        default_factory=partial(_get_bool_env, "FILE_FINDER_ENABLE_CACHING")
+    )
+    cache_size: int = field(
+        default_factory=lambda: int(os.getenv("FILE_FINDER_CACHE_SIZE", "1000"))
+    )
+
+    # logging module level for log_level, resolved once
+    numeric_level: int = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "numeric_level", getattr(logging, self.log_level.upper(), logging.INFO)
         )
-        self.cache_size: int = int(os.getenv("FILE_FINDER_CACHE_SIZE", "1000"))
 
-    @staticmethod
-    def _get_int_env(key: str) -> int | None:
-        """Get integer value from environment variable."""
-        value = os.getenv(key)
-        if value is None:
-            return None
-        try:
-            return int(value)
-        except ValueError:
-            return None
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Build a configuration from the current environment variables."""
+        return cls()
 
 
 # Global configuration instance
-config = Config()
+config = Config.from_env()
+
+# Settings and handlers of the last setup_logging() call per logger name, so an
+# identical call can return early
+_logging_setups: dict[str, tuple[tuple[int, str, str | None], list[logging.Handler]]] = {}
 
 
 def setup_logging(
@@ -64,20 +103,33 @@ def setup_logging(
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         format_string: Format string for log messages
         log_file: Optional file path to write logs to
+
+    Calling it again with the same effective settings leaves the installed
+    handlers in place.
     """
-    level = level or config.log_level
     format_string = format_string or config.log_format
     log_file = log_file or config.log_file
 
     # Convert string level to logging constant
-    numeric_level = getattr(logging, level.upper(), logging.INFO)
+    if not level:
+        numeric_level = config.numeric_level
+    else:
+        numeric_level = getattr(logging, level.upper(), logging.INFO)
 
     # Configure root logger for the file_finder package
     logger = logging.getLogger("file_finder")
+    settings = (numeric_level, format_string, log_file)
+    if (
+        _logging_setups.get(logger.name) == (settings, logger.handlers)
+        and logger.level == numeric_level
+        and not logger.propagate
+    ):
+        return
     logger.setLevel(numeric_level)
 
-    # Remove existing handlers
-    logger.handlers.clear()
+    # Remove existing handlers; rebinding the list (rather than clearing it) keeps a
+    # record that is being dispatched to the old handlers from reaching the new ones
+    logger.handlers = []
 
     # Create console handler
     console_handler = logging.StreamHandler()
@@ -98,6 +150,32 @@ def setup_logging(
 
     # Prevent propagation to root logger
     logger.propagate = False
+    _logging_setups[logger.name] = (settings, list(logger.handlers))
+
+
+class _DeferredSetupHandler(logging.Handler):
+    """
+    Placeholder handler that runs setup_logging() when the first record arrives.
+
+    Keeps import free of handler construction and of the log file's mkdir; a
+    library that never logs never pays for them.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Configure the real handlers, then hand them the record."""
+        package_logger = logging.getLogger("file_finder")
+        if self in package_logger.handlers:
+            setup_logging()
+        package_logger.handle(record)
+
+
+def _defer_logging_setup() -> None:
+    """Install the deferred handler, with the configured level so records reach it."""
+    logger = logging.getLogger("file_finder")
+    if not logger.handlers:
+        logger.setLevel(config.numeric_level)
+        logger.addHandler(_DeferredSetupHandler())
+        logger.propagate = False
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -110,12 +188,7 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
-    # Ensure logging is set up
-    if not logging.getLogger("file_finder").handlers:
-        setup_logging()
+    # Ensure logging will be set up once something is logged
+    _defer_logging_setup()
 
     return logging.getLogger(f"file_finder.{name}")
-
-
-# Set up logging on module import
-setup_logging()
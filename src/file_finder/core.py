@@ -5,18 +5,283 @@ This library provides a fluent API for searching files based on various conditio
 such as extension, size, location, name patterns, and modification time.
 """
 
+import asyncio
+import heapq
+import logging
+import operator
 import os
+import queue
 import re
-from collections.abc import Callable, Generator
+import stat
+import threading
+from bisect import bisect_right
+from collections import deque
+from collections.abc import AsyncGenerator, Callable, Generator, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import cache, lru_cache, partial, reduce
+from itertools import compress, islice
 from pathlib import Path
 
-from file_finder.config import get_logger
+from file_finder import _batch, _fastwalk
+from file_finder._dir_cache import dir_cache, letter_mask
+from file_finder.config import config, get_logger
 
 logger = get_logger(__name__)
 
 
+# Relative evaluation cost of condition leaves, used to order AND/OR operands
+_COST_NAME = 0
+_COST_PATH = 1
+_COST_STAT_SIZE = 2
+_COST_STAT_TIME = 3
+_COST_REGEX = 4
+_COST_CONTENT = 5
+
+# Directory reading backends accepted by FileFinder
+_BACKENDS = ("scandir", "getdents")
+
+# Directory visiting orders accepted by FileFinder
+_TRAVERSAL_ORDERS = ("dfs", "bfs", "inode")
+
+# Sentinel queued by the parallel walker once every directory has been scanned
+_SCAN_DONE = object()
+
+# Up to this many extensions, one str.endswith(tuple) beats slicing the suffix
+# for a set lookup; beyond it the scan over the tuple costs more than the hash
+_ENDSWITH_MAX_SUFFIXES = 48
+
+# Pending directories a parallel walk needs before it starts its thread pool;
+# smaller trees are scanned inline, where the pool would cost more than it saves
+_PARALLEL_MIN_DIRS = 8
+
+# Extensions recognized by the is_image()/is_video()/... helpers
+_IMAGE_EXTENSIONS = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".svg", ".webp", ".tiff", ".ico"}
+)
+_VIDEO_EXTENSIONS = frozenset(
+    {".mp4", ".avi", ".mov", ".mkv", ".flv", ".wmv", ".webm", ".m4v", ".mpg", ".mpeg"}
+)
+_AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma", ".m4a", ".opus"})
+_DOCUMENT_EXTENSIONS = frozenset(
+    {".pdf", ".doc", ".docx", ".txt", ".odt", ".rtf", ".md", ".markdown"}
+)
+_ARCHIVE_EXTENSIONS = frozenset({".zip", ".tar", ".gz", ".bz2", ".7z", ".rar", ".xz", ".tgz"})
+
+
+@dataclass(slots=True)
+class _CandidateCtx:
+    """
+    Per-candidate evaluation state shared by every predicate in a condition chain.
+
+    The stat result and lower-cased name are computed on first use and memoized,
+    so a chain combining several size/time predicates issues a single stat call,
+    and a chain rejected by a cheap name predicate never stats at all.
+    """
+
+    entry: os.DirEntry | None
+    follow_symlinks: bool = False
+    _path: Path | None = None
+    # Path of the directory the walker listed the candidate from, if known
+    _parent: str | None = None
+    # True when the walker knows _parent is already its own real path
+    _parent_is_real: bool = False
+    _stat_cache: os.stat_result | None = field(default=None, init=False)
+    _name_lower: str | None = field(default=None, init=False)
+
+    @property
+    def name(self) -> str:
+        """File name of the candidate."""
+        if self.entry is not None:
+            return self.entry.name
+        return self.path.name
+
+    @property
+    def name_lower(self) -> str:
+        """Lower-cased file name of the candidate (memoized)."""
+        if self._name_lower is None:
+            self._name_lower = self.name.lower()
+        return self._name_lower
+
+    @property
+    def path_str(self) -> str:
+        """Full path of the candidate as a string."""
+        if self.entry is not None:
+            return self.entry.path
+        return str(self._path)
+
+    @property
+    def parent_str(self) -> str:
+        """Path of the candidate's directory as a string ("." for a bare name)."""
+        if self._parent is None:
+            parent, sep, _ = self.path_str.rpartition(os.sep)
+            # A bare name lives in the working directory, "/name" in the filesystem root
+            self._parent = parent or sep or os.curdir
+        return self._parent
+
+    @property
+    def path(self) -> Path:
+        """Full path of the candidate, materialized on first access."""
+        if self._path is None:
+            self._path = Path(self.entry.path)
+        return self._path
+
+    def stat(self) -> os.stat_result:
+        """Stat the candidate once and reuse the result for later predicates."""
+        if self._stat_cache is None:
+            if self.entry is not None:
+                self._stat_cache = self.entry.stat(follow_symlinks=self.follow_symlinks)
+            else:
+                self._stat_cache = self._path.stat(follow_symlinks=self.follow_symlinks)
+        return self._stat_cache
+
+
+@dataclass(frozen=True, slots=True)
+class _TraversalPlan:
+    """Where a walk starts and which subdirectories it never needs to open."""
+
+    # (directory, depth) pairs to start scanning from
+    starts: tuple[tuple[str, int], ...]
+    # Names of subdirectories whose contents can never match
+    excluded_dirs: frozenset[str] = frozenset()
+    # Detects links back to an ancestor, used only when symlinks are followed
+    loop_guard: "_LoopGuard | None" = None
+
+
+class _LoopGuard:
+    """
+    Thread-safe record of the directories a symlink-following walk has entered.
+
+    A directory whose device and inode match one of its own ancestors on its
+    path is a link back up the tree and is not scanned, where the walk would
+    otherwise recurse until the path length or ELOOP stops it. Directories
+    reached by two different paths (two links to one target, bind mounts) are
+    not loops and are scanned under each path. Ancestors are always entered
+    before their descendants are discovered, so the outcome does not depend on
+    the order (or thread) in which directories are scanned.
+    """
+
+    __slots__ = ("_ids", "_lock", "_root")
+
+    def __init__(self, root: str):
+        self._root = root.rstrip(os.sep) or os.sep
+        self._ids: dict[str, tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def is_loop(self, directory: str) -> bool:
+        """Record a directory about to be scanned; return True if it repeats an ancestor."""
+        try:
+            st = Path(directory).stat()
+        except OSError:
+            # Let the scan itself report the unreadable directory
+            return False
+        key = (st.st_dev, st.st_ino)
+        directory = directory.rstrip(os.sep) or os.sep
+        with self._lock:
+            ancestor = directory
+            while len(ancestor) > len(self._root):
+                ancestor = ancestor.rpartition(os.sep)[0] or os.sep
+                if self._ids.get(ancestor) == key:
+                    return True
+            self._ids[directory] = key
+            return False
+
+
+@dataclass(frozen=True, slots=True)
+class FileInfo:
+    """A search result with the stat fields FileFinder already read for it."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+    is_dir: bool
+
+
+def _folds_like_lower(text: str) -> bool:
+    """
+    Return True if an IGNORECASE regex for lower-cased ``text`` finds every name
+    whose ``str.lower()`` contains it.
+
+    Some characters lower-case to several code points ("İ" becomes "i" plus a
+    combining dot), which IGNORECASE matching, one character at a time, cannot
+    follow. ASCII text is never affected.
+    """
+    return text.isascii()
+
+
+def _literal_regex(text: str, case_sensitive: bool) -> str:
+    """Return a regex matching ``text`` literally, optionally ignoring case."""
+    escaped = re.escape(text)
+    return escaped if case_sensitive else f"(?i:{escaped})"
+
+
+def _is_embeddable(pattern: str) -> bool:
+    """Return True if a user regex can be safely nested inside a larger pattern."""
+    # Global inline flags, numbered/named backreferences and conditional group
+    # references such as "(?(1)a|b)" break when nested
+    return (
+        re.match(r"\(\?[aiLmsux]+\)", pattern) is None
+        and re.search(r"\\[1-9]|\(\?P=|\(\?\(", pattern) is None
+    )
+
+
+# A literal run: word characters, "-", or backslash-escaped punctuation such as "\.";
+# an escaped "|" is left to the regex engine, since alternatives are split on "|"
+_LITERAL = r"(?:[\w-]|\\[^\w\s|])+"
+# Optionally anchored literal or group of literal alternatives, e.g. "^(file|demo).*"
+_LITERAL_PATTERN = re.compile(
+    rf"(?P<start>\^|\\A)?(?P<lead>\.\*)?"
+    rf"(?:\((?:\?:)?(?P<alternatives>{_LITERAL}(?:\|{_LITERAL})*)\)|(?P<literal>{_LITERAL}))"
+    rf"(?P<trail>\.\*)?(?P<end>\$|\\Z)?"
+)
+
+
+def _literal_name_test(pattern: str) -> tuple[Callable[[str], bool], tuple[str, ...]] | None:
+    r"""
+    Lower a regex that is only an alternation of literals to plain string tests.
+
+    Anchors select the test: "^" gives str.startswith, "$" or "\Z" str.endswith,
+    both an exact set lookup, and neither a substring check. A ".*" next to an
+    unanchored side matches the empty string, so it is dropped.
+
+    Returns:
+        (test taking a file name, the literals), or None if the pattern needs
+        the regex engine
+    """
+    parsed = _LITERAL_PATTERN.fullmatch(pattern)
+    if parsed is None:
+        return None
+    start, lead, alternatives, literal, trail, end = parsed.group(
+        "start", "lead", "alternatives", "literal", "trail", "end"
+    )
+    # ".*" does not match newlines, so next to an anchor it is not a no-op
+    if (start and lead) or (end and trail):
+        return None
+
+    literals = tuple(
+        re.sub(r"\\(.)", r"\1", lit)
+        for lit in (alternatives.split("|") if alternatives else [literal])
+    )
+    # "$" also matches just before a trailing newline
+    ends = literals + tuple(lit + "\n" for lit in literals) if end == "$" else literals
+
+    if start and end:
+        return frozenset(ends).__contains__, literals
+    if start:
+        return lambda name: name.startswith(literals), literals
+    if end:
+        return lambda name: name.endswith(ends), literals
+    return lambda name: any(lit in name for lit in literals), literals
+
+
+# Sort key and evaluator of an operand, as C-level callables for long operand lists
+_cost_of = operator.attrgetter("_cost")
+_match_of = operator.attrgetter("_match")
+
+
 class ConditionOperator(Enum):
     """Operators for combining conditions."""
 
@@ -45,25 +310,418 @@ class Condition:
             description: Human-readable description of the condition
         """
         self.predicate = predicate
-        self.description = description
-        self.operator = None
-        self.next_condition = None
-        logger.debug(f"Created condition: {description}")
+        self._description: str | None = description
+        self.operator: ConditionOperator | None = None
+        self.children: tuple[Condition, ...] = ()
+        # Opaque user predicates may do anything, so they are assumed to be the most expensive
+        self._cost = _COST_CONTENT
+        self._ordered_children: tuple[Condition, ...] = ()
+        # Evaluators of the ordered operands, as captured by the node's evaluator
+        self._operand_matches: tuple[Callable[[_CandidateCtx], bool], ...] = ()
+        # Regex (search semantics) that every matching file name satisfies, if known
+        self._name_regex: str | None = None
+        self._name_matcher: Callable[[str], bool] | None = None
+        self._name_matcher_compiled = False
+        # Vectorized form of a leaf, evaluated on a whole CandidateBatch (batch_mode)
+        self._batch: Callable[[_batch.CandidateBatch], _batch.np.ndarray] | None = None
+        # Letters (see letter_mask) every matching file name contains, 0 if unknown
+        self._letters = 0
+        # Exact test of a name-only leaf that is cheaper than its regex, if any
+        self._name_test: Callable[[str], bool] | None = None
+        # Directory names no match can lie under, and absolute directories every match lies under
+        self._excluded_dirs: frozenset[str] = frozenset()
+        self._start_dirs: tuple[Path, ...] = ()
+        # Identity of a built-in leaf (factory name and parameters), used to spot duplicates
+        self._key: tuple | None = None
+        self._canonical: Condition | None = None
+        # Drops state a leaf caches about the filesystem; run by finalize before each search
+        self._reset_caches: Callable[[], None] | None = None
+        # Whole-tree evaluator generated from the finalized operand order
+        self._evaluator: Callable[[_CandidateCtx], bool] | None = None
+        self._match: Callable[[_CandidateCtx], bool] = lambda ctx: predicate(ctx.path, ctx.entry)
+
+    @classmethod
+    def _leaf(
+        cls, match: Callable[[_CandidateCtx], bool], description: str, cost: int
+    ) -> "Condition":
+        """Create a built-in condition that evaluates directly against a candidate context."""
+
+        def predicate(path: Path, entry: os.DirEntry | None) -> bool:
+            return match(_CandidateCtx(entry, config.default_follow_symlinks, path))
+
+        condition = cls(predicate, description)
+        condition._match = match
+        condition._cost = cost
+        return condition
+
+    @property
+    def description(self) -> str:
+        """Human-readable description of the condition."""
+        if self._description is None:
+            # Built on first use, so chaining many operands does not rebuild it per link
+            joiner = f" {self.operator.value} "
+            self._description = "(" + joiner.join(c.description for c in self.children) + ")"
+        return self._description
+
+    @description.setter
+    def description(self, value: str) -> None:
+        self._description = value
+
+    @classmethod
+    def _combine(cls, operator: ConditionOperator, *children: "Condition") -> "Condition":
+        """Create a node combining conditions, evaluating the cheapest operands first."""
+        # Name checks go ahead of stat-requiring predicates even before finalize, so
+        # direct evaluate() calls short-circuit the same way searches do
+        ordered = tuple(sorted(children, key=_cost_of))
+        return cls._node(operator, children, ordered, max(map(_cost_of, children)))
+
+    @classmethod
+    def _node(
+        cls,
+        op: ConditionOperator,
+        children: tuple["Condition", ...],
+        ordered: tuple["Condition", ...],
+        cost: int,
+        matches: tuple[Callable[[_CandidateCtx], bool], ...] | None = None,
+    ) -> "Condition":
+        """Create an n-ary node from its operands, already sorted by cost."""
+        node = cls(lambda path, entry: False)
+        node._description = None
+        node.predicate = node.evaluate
+        node.operator = op
+        node.children = children
+        node._ordered_children = ordered
+        node._cost = cost
+        node._bind_operands(matches)
+        return node
+
+    def _chain(self, op: ConditionOperator, other: "Condition") -> "Condition":
+        """
+        Combine this condition with another, extending this node if it has the same operator.
+
+        Chained calls such as ``a.AND(b).AND(c)`` thus build one n-ary node
+        rather than a nested tree, so nothing recurses once per link. This
+        condition is left unchanged.
+        """
+        if self.operator is not op:
+            return Condition._combine(op, self, other)
+        # A stable insertion keeps the operand order that sorting all operands would give
+        ordered = self._ordered_children
+        i = bisect_right(ordered, other._cost, key=_cost_of)
+        matches = self._operand_matches
+        return Condition._node(
+            op,
+            (*self.children, other),
+            (*ordered[:i], other, *ordered[i:]),
+            max(self._cost, other._cost),
+            (*matches[:i], other._match, *matches[i:]),
+        )
+
+    def _bind_operands(
+        self, matches: tuple[Callable[[_CandidateCtx], bool], ...] | None = None
+    ) -> None:
+        """
+        Rebuild this node's evaluator as a flat loop over its ordered operands.
+
+        The operands' evaluators are captured directly, so evaluating a leaf
+        under a node costs one call, and the loop returns on the first operand
+        that decides the result.
+
+        Args:
+            matches: The operands' evaluators in order, if already collected
+        """
+        if matches is None:
+            matches = tuple(map(_match_of, self._ordered_children))
+        self._operand_matches = matches
+        if self.operator is ConditionOperator.AND:
+            # Plain loops: all()/any() over a generator cost a frame per operand
+            def match(ctx: _CandidateCtx) -> bool:
+                for operand in matches:  # noqa: SIM110
+                    if not operand(ctx):
+                        return False
+                return True
+
+        else:
+
+            def match(ctx: _CandidateCtx) -> bool:
+                for operand in matches:  # noqa: SIM110
+                    if operand(ctx):
+                        return True
+                return False
+
+        self._match = match
 
     def AND(self, other: "Condition") -> "Condition":
         """Combine this condition with another using AND logic."""
-        self.operator = ConditionOperator.AND
-        self.next_condition = other
-        logger.debug(f"Combined conditions with AND: {self.description} AND {other.description}")
-        return self
+        if logger.isEnabledFor(logging.DEBUG):
+            # Describing a long chain costs time proportional to its length
+            logger.debug(
+                "Combined conditions with AND: %s AND %s", self.description, other.description
+            )
+        return self._chain(ConditionOperator.AND, other)
 
     def OR(self, other: "Condition") -> "Condition":
         """Combine this condition with another using OR logic."""
-        self.operator = ConditionOperator.OR
-        self.next_condition = other
-        logger.debug(f"Combined conditions with OR: {self.description} OR {other.description}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Combined conditions with OR: %s OR %s", self.description, other.description
+            )
+        return self._chain(ConditionOperator.OR, other)
+
+    def _canonicalize(self) -> "Condition":
+        """
+        Return an equivalent, smaller tree to evaluate in place of this one.
+
+        Nested nodes with the same operator are flattened into one n-ary node,
+        repeated operands (the same object, or built-in leaves with the same
+        parameters) are dropped, and extension or name_contains leaves under an
+        OR are merged into a single leaf testing all their patterns. Conditions
+        never change once built, so the result is computed once and cached.
+        """
+        if self.operator is None:
+            return self
+        if self._canonical is None:
+            children: list[Condition] = []
+            for child in self.children:
+                child = child._canonicalize()
+                if child.operator is self.operator:
+                    children.extend(child.children)
+                else:
+                    children.append(child)
+
+            seen: set = set()
+            unique = []
+            for child in children:
+                key = child._key if child._key is not None else id(child)
+                if key not in seen:
+                    seen.add(key)
+                    unique.append(child)
+            if self.operator is ConditionOperator.OR:
+                unique = Condition._merge_leaves(unique)
+
+            if len(unique) == 1:
+                self._canonical = unique[0]
+            elif unique == list(self.children):
+                self._canonical = self
+            else:
+                self._canonical = Condition._combine(self.operator, *unique)
+        return self._canonical
+
+    @staticmethod
+    def _merge_leaves(children: list["Condition"]) -> list["Condition"]:
+        """
+        Merge OR-ed leaves of the same kind into one leaf testing all their patterns.
+
+        Covers extension leaves, name_contains leaves of equal case sensitivity,
+        and name_matches or path_matches leaves that need the regex engine, which
+        become a single alternation searched once per file.
+        """
+        groups: dict[tuple, list[Condition]] = {}
+        order: list[Condition | tuple] = []
+        for child in children:
+            key = child._key
+            if key is None or key[0] not in {
+                "extension",
+                "name_contains",
+                "name_matches",
+                "path_matches",
+            }:
+                order.append(child)
+                continue
+            if key[0] in {"name_matches", "path_matches"} and (
+                # Literal patterns already skip the regex engine; others must embed safely
+                child._cost != _COST_REGEX or not _is_embeddable(key[1])
+            ):
+                order.append(child)
+                continue
+            # The last key item holds the patterns; everything before it must agree
+            group = key[:-1]
+            if group not in groups:
+                groups[group] = []
+                order.append(group)
+            groups[group].append(child)
+
+        merged: list[Condition] = []
+        for item in order:
+            if isinstance(item, Condition):
+                merged.append(item)
+                continue
+            members = groups[item]
+            if len(members) == 1:
+                merged.append(members[0])
+                continue
+            if item[0] in {"name_matches", "path_matches"}:
+                merged.extend(Condition._merge_regex_leaves(item[0], members))
+                continue
+            patterns = sorted(frozenset().union(*(member._key[-1] for member in members)))
+            if item[0] == "extension":
+                merged.append(Condition.extension(*patterns))
+            else:
+                merged.append(Condition._name_contains_any(patterns, case_sensitive=item[1]))
+        return merged
+
+    @staticmethod
+    def _merge_regex_leaves(kind: str, members: list["Condition"]) -> list["Condition"]:
+        """Fuse OR-ed regex leaves into one alternation, or keep them if it won't compile."""
+        pattern = "|".join(f"(?:{member._key[-1]})" for member in members)
+        try:
+            # Fails e.g. when two patterns define the same group name
+            re.compile(pattern)
+        except re.error:
+            return members
+        if kind == "name_matches":
+            return [Condition.name_matches(pattern)]
+        return [Condition.path_matches(pattern)]
+
+    def finalize(self, preserve_order: bool = False) -> "Condition":
+        """
+        Plan the evaluation order of this condition tree.
+
+        Operands of every AND/OR node are stably sorted by estimated cost, so
+        cheap name checks run first and stat-requiring predicates often never
+        run at all. Leaves drop anything they cached about the filesystem
+        during an earlier search. Called once by FileFinder.search before the
+        walk.
+
+        Args:
+            preserve_order: If True, evaluate operands in the order they were written
+
+        Returns:
+            This condition, for chaining
+        """
+        if self.operator is None:
+            if self._reset_caches is not None:
+                self._reset_caches()
+            return self
+        for child in self.children:
+            child.finalize(preserve_order)
+        if preserve_order:
+            self._ordered_children = self.children
+        else:
+            self._ordered_children = tuple(sorted(self.children, key=lambda c: c._cost))
+        self._bind_operands()
+        self._evaluator = None
         return self
 
+    def compile_evaluator(self) -> Callable[[_CandidateCtx], bool]:
+        """
+        Generate one function evaluating the whole tree with inline and/or.
+
+        The tree is emitted as a single Python expression such as
+        ``m0(ctx) and (m1(ctx) or m2(ctx))`` with each leaf bound to a name, so
+        nested nodes cost no calls of their own and the interpreter's jumps do
+        the short-circuiting. The function is cached until the next finalize.
+        Trees too deeply nested for the compiler use the per-node evaluators.
+
+        Returns:
+            A function taking a candidate context
+        """
+        if self._evaluator is None:
+            if self.operator is None:
+                self._evaluator = self._match
+            else:
+                leaves: dict[str, Callable[[_CandidateCtx], bool]] = {}
+                try:
+                    source = f"def evaluate(ctx):\n    return {self._evaluator_source(leaves)}\n"
+                    exec(compile(source, "<condition>", "exec"), leaves)
+                    self._evaluator = leaves["evaluate"]
+                except (SyntaxError, RecursionError, MemoryError):
+                    self._evaluator = self._match
+        return self._evaluator
+
+    def _evaluator_source(self, leaves: dict[str, Callable[[_CandidateCtx], bool]]) -> str:
+        """Emit the expression for this subtree, registering each leaf's evaluator."""
+        if self.operator is None:
+            name = f"m{len(leaves)}"
+            leaves[name] = self._match
+            return f"{name}(ctx)"
+        joiner = " and " if self.operator is ConditionOperator.AND else " or "
+        return "(" + joiner.join(c._evaluator_source(leaves) for c in self._ordered_children) + ")"
+
+    def compile_name_matcher(self) -> Callable[[str], bool] | None:
+        """
+        Fuse the name-only leaves of this condition into a single regex prefilter.
+
+        The returned function is a necessary condition: a file name it rejects
+        can never satisfy the full condition, so callers can skip building a
+        candidate for it. The matcher is built once and cached.
+
+        Returns:
+            A function taking a file name, or None if the condition cannot be
+            decided from names alone (e.g. an OR with a size predicate)
+        """
+        if not self._name_matcher_compiled and self._name_test is not None:
+            # A lone leaf with a specialized test does not need the regex engine
+            self._name_matcher = self._name_test
+            self._name_matcher_compiled = True
+        if not self._name_matcher_compiled:
+            pattern = self._name_pattern()
+            if pattern is not None:
+                try:
+                    self._name_matcher = re.compile(pattern).search
+                except re.error:
+                    self._name_matcher = None
+            self._name_matcher_compiled = True
+        return self._name_matcher
+
+    def _name_pattern(self) -> str | None:
+        """Build the fused name regex for this subtree, or None if names can't decide it."""
+        if self.operator is None:
+            return self._name_regex
+
+        patterns = [child._name_pattern() for child in self.children]
+        if self.operator is ConditionOperator.OR:
+            if None in patterns:
+                return None
+            return "|".join(f"(?:{pattern})" for pattern in patterns)
+
+        known = [pattern for pattern in patterns if pattern is not None]
+        if not known:
+            return None
+        if len(known) == 1:
+            return known[0]
+        # AND of several name patterns: every one must match somewhere in the name
+        return r"\A" + "".join(rf"(?=[\s\S]*?(?:{pattern}))" for pattern in known)
+
+    def _required_letters(self) -> int:
+        """
+        Return the letter mask every file name matching this condition covers.
+
+        Used with the dir cache, whose entries carry their name's letter mask,
+        to reject names with one bitwise test. 0 means no letters are required.
+        """
+        if self.operator is None:
+            return self._letters
+        masks = [child._required_letters() for child in self.children]
+        if self.operator is ConditionOperator.AND:
+            return reduce(operator.or_, masks)
+        return reduce(operator.and_, masks)
+
+    def _traversal_hints(self) -> tuple[frozenset[str], tuple[Path, ...]]:
+        """
+        Collect directory-level facts that hold for every file this condition matches.
+
+        Only leaves reached through AND nodes count: under an OR, the other
+        operand may still match files inside an excluded directory.
+
+        Returns:
+            (directory names whose subtrees can be skipped, absolute directories
+            the walk can start from instead of the root; empty if unknown)
+        """
+        if self.operator is None:
+            return self._excluded_dirs, self._start_dirs
+        if self.operator is not ConditionOperator.AND:
+            return frozenset(), ()
+
+        excluded: frozenset[str] = frozenset()
+        start_dirs: tuple[Path, ...] = ()
+        for child in self.children:
+            child_excluded, child_start_dirs = child._traversal_hints()
+            excluded |= child_excluded
+            # Any one operand's directories bound every match of the AND
+            start_dirs = start_dirs or child_start_dirs
+        return excluded, start_dirs
+
     def evaluate(self, path: Path, entry: os.DirEntry | None = None) -> bool:
         """
         Evaluate this condition and any chained conditions.
@@ -75,24 +733,51 @@ class Condition:
         Returns:
             True if all conditions are met, False otherwise
         """
-        # Evaluate current condition
-        current_result = self.predicate(path, entry)
+        return self._match(_CandidateCtx(entry, config.default_follow_symlinks, path))
+
+    def evaluate_batch(
+        self, batch: _batch.CandidateBatch, rows: "_batch.np.ndarray | None" = None
+    ) -> "_batch.np.ndarray":
+        """
+        Evaluate this condition for every candidate of a batch at once.
 
-        # If no chained conditions, return current result
-        if self.next_condition is None:
-            return current_result
+        Size and time leaves compare whole NumPy columns; other leaves fall back
+        to per-row evaluation, restricted to rows whose outcome is still open.
+        Requires NumPy.
 
-        # Apply operator logic
-        if self.operator == ConditionOperator.AND:
-            return current_result and self.next_condition.evaluate(path, entry)
-        if self.operator == ConditionOperator.OR:
-            return current_result or self.next_condition.evaluate(path, entry)
+        Args:
+            batch: Candidates with their stat columns
+            rows: Boolean mask of rows to evaluate (default: all rows)
 
-        return current_result
+        Returns:
+            Boolean array with one entry per candidate; unselected rows are False
+        """
+        if rows is None:
+            rows = batch.all_rows()
+
+        if self.operator is None:
+            if self._batch is not None:
+                # Vectorized leaves read stat columns; stat only the rows still open
+                batch.load_stats(rows)
+                return rows & self._batch(batch)
+            return batch.evaluate_rows(self._match, rows)
+
+        if self.operator is ConditionOperator.AND:
+            # Each operand only sees the rows every earlier operand accepted
+            for child in self._ordered_children:
+                rows = child.evaluate_batch(batch, rows)
+            return rows
+
+        matched = ~rows
+        for child in self._ordered_children:
+            matched |= child.evaluate_batch(batch, ~matched)
+        return matched & rows
 
     # ===== Extension Conditions =====
 
+    # Leaves are immutable once built, so repeated calls share one leaf per argument list
     @staticmethod
+    @lru_cache(maxsize=256)
     def extension(*extensions: str) -> "Condition":
         """
         Match files with specific extensions.
@@ -103,18 +788,36 @@ class Condition:
         Example:
             Condition.extension('.png', '.jpg', '.gif')
         """
-        # Normalize extensions to lowercase and ensure they start with a dot
-        normalized = set()
-        for ext in extensions:
-            ext = ext.lower()
-            if not ext.startswith("."):
-                ext = "." + ext
-            normalized.add(ext)
-
-        def predicate(path: Path, entry: os.DirEntry | None) -> bool:
-            return path.suffix.lower() in normalized
-
-        return Condition(predicate, f"extension in {extensions}")
+        # Normalize once to lowercase extensions without the leading dot
+        normalized = frozenset(ext.lower().removeprefix(".") for ext in extensions)
+        # Same rules as Path.suffix: only the text after the last dot counts, so
+        # empty or dotted extensions can never match
+        suffixes = tuple(f".{ext}" for ext in sorted(normalized) if ext and "." not in ext)
+
+        if len(suffixes) <= _ENDSWITH_MAX_SUFFIXES:
+
+            def match(ctx: _CandidateCtx) -> bool:
+                name = ctx.name_lower
+                # A name that is only a leading dot plus the extension has no suffix
+                return name.endswith(suffixes) and name.rfind(".") > 0
+
+        else:
+
+            def match(ctx: _CandidateCtx) -> bool:
+                name = ctx.name_lower
+                i = name.rfind(".")
+                return 0 < i < len(name) - 1 and name[i + 1 :] in normalized
+
+        condition = Condition._leaf(match, f"extension in {extensions}", _COST_NAME)
+        # The prefilter only admits the suffixes above, so names ending in an extension
+        # that can never match (such as ".tar.gz") are skipped before the leaf runs
+        if all(map(_folds_like_lower, suffixes)):
+            alternatives = "|".join(re.escape(suffix) for suffix in suffixes)
+            condition._name_regex = rf"(?i:{alternatives or '(?!)'})\Z"
+        if suffixes:
+            condition._letters = reduce(operator.and_, map(letter_mask, suffixes))
+        condition._key = ("extension", normalized)
+        return condition
 
     # ===== Size Conditions =====
 
@@ -130,15 +833,16 @@ class Condition:
             Condition.size_greater_than(5 * 1024 * 1024)  # > 5MB
         """
 
-        def predicate(path: Path, entry: os.DirEntry | None) -> bool:
+        def match(ctx: _CandidateCtx) -> bool:
             try:
-                if entry and hasattr(entry, "stat"):
-                    return entry.stat(follow_symlinks=False).st_size > size_bytes
-                return path.stat().st_size > size_bytes
+                return ctx.stat().st_size > size_bytes
             except (OSError, PermissionError):
                 return False
 
-        return Condition(predicate, f"size > {size_bytes} bytes")
+        condition = Condition._leaf(match, f"size > {size_bytes} bytes", _COST_STAT_SIZE)
+        condition._batch = lambda batch: batch.stat_ok & (batch.sizes > size_bytes)
+        condition._key = ("size_greater_than", size_bytes)
+        return condition
 
     @staticmethod
     def size_less_than(size_bytes: int) -> "Condition":
@@ -152,15 +856,16 @@ class Condition:
             Condition.size_less_than(1024)  # < 1KB
         """
 
-        def predicate(path: Path, entry: os.DirEntry | None) -> bool:
+        def match(ctx: _CandidateCtx) -> bool:
             try:
-                if entry and hasattr(entry, "stat"):
-                    return entry.stat(follow_symlinks=False).st_size < size_bytes
-                return path.stat().st_size < size_bytes
+                return ctx.stat().st_size < size_bytes
             except (OSError, PermissionError):
                 return False
 
-        return Condition(predicate, f"size < {size_bytes} bytes")
+        condition = Condition._leaf(match, f"size < {size_bytes} bytes", _COST_STAT_SIZE)
+        condition._batch = lambda batch: batch.stat_ok & (batch.sizes < size_bytes)
+        condition._key = ("size_less_than", size_bytes)
+        return condition
 
     @staticmethod
     def size_between(min_bytes: int, max_bytes: int) -> "Condition":
@@ -175,17 +880,21 @@ class Condition:
             Condition.size_between(1024, 5 * 1024 * 1024)  # 1KB to 5MB
         """
 
-        def predicate(path: Path, entry: os.DirEntry | None) -> bool:
+        def match(ctx: _CandidateCtx) -> bool:
             try:
-                if entry and hasattr(entry, "stat"):
-                    size = entry.stat(follow_symlinks=False).st_size
-                else:
-                    size = path.stat().st_size
+                size = ctx.stat().st_size
                 return min_bytes <= size <= max_bytes
             except (OSError, PermissionError):
                 return False
 
-        return Condition(predicate, f"size between {min_bytes} and {max_bytes} bytes")
+        condition = Condition._leaf(
+            match, f"size between {min_bytes} and {max_bytes} bytes", _COST_STAT_SIZE
+        )
+        condition._batch = lambda batch: (
+            batch.stat_ok & (batch.sizes >= min_bytes) & (batch.sizes <= max_bytes)
+        )
+        condition._key = ("size_between", min_bytes, max_bytes)
+        return condition
 
     # ===== Location Conditions =====
 
@@ -212,22 +921,49 @@ class Condition:
                 # Treat as directory name to match anywhere in path
                 dir_names.add(d)
 
-        def predicate(path: Path, entry: os.DirEntry | None) -> bool:
-            # Resolve path to handle symlinks and normalize
-            resolved_path = path.resolve()
+        dir_prefixes = tuple(
+            str(d) if str(d).endswith(os.sep) else str(d) + os.sep for d in dir_paths
+        )
+        # A name matches a whole path component, so it is searched for between
+        # separators; a name that itself contains a separator is never a component
+        needles = tuple(
+            f"{os.sep}{name}{os.sep}" for name in sorted(dir_names) if os.sep not in name
+        )
 
-            # Check if file is within any specified absolute path
-            for dir_path in dir_paths:
-                try:
-                    resolved_path.relative_to(dir_path)
+        # Files of one directory arrive together, so small caches decide each parent
+        # once; the answer only depends on the parent's real path. Walkers hand every
+        # file of a directory the same parent string, so lookups are cheap
+        @lru_cache(maxsize=1024)
+        def real_parent_matches(real_parent: str) -> bool:
+            real_dir = real_parent.rstrip(os.sep) + os.sep
+            if real_dir.startswith(dir_prefixes):
+                return True
+            for needle in needles:  # noqa: SIM110
+                if needle in real_dir:
                     return True
-                except ValueError:
-                    continue
-
-            # Check if any parent directory name matches
-            return any(parent.name in dir_names for parent in resolved_path.parents)
-
-        return Condition(predicate, f"in directory {directories}")
+            return False
+
+        # A parent's real path changes when a symlink along it is replaced, so this
+        # cache is cleared before every search (see finalize)
+        @lru_cache(maxsize=1024)
+        def parent_matches(parent: str) -> bool:
+            return real_parent_matches(os.path.realpath(parent))
+
+        def match(ctx: _CandidateCtx) -> bool:
+            is_symlink = ctx.entry.is_symlink() if ctx.entry is not None else ctx.path.is_symlink()
+            if is_symlink:
+                # The link's target may live anywhere, so resolve it in full
+                return real_parent_matches(str(ctx.path.resolve().parent))
+            if ctx._parent_is_real:
+                return real_parent_matches(ctx.parent_str)
+            return parent_matches(ctx.parent_str)
+
+        condition = Condition._leaf(match, f"in directory {directories}", _COST_PATH)
+        condition._reset_caches = parent_matches.cache_clear
+        if dir_paths and not dir_names:
+            condition._start_dirs = tuple(sorted(dir_paths))
+        condition._key = ("in_directory", frozenset(dir_paths), frozenset(dir_names))
+        return condition
 
     @staticmethod
     def not_in_directory(*directories: str) -> "Condition":
@@ -243,10 +979,17 @@ class Condition:
         # Reuse in_directory logic and invert
         in_dir_condition = Condition.in_directory(*directories)
 
-        def predicate(path: Path, entry: os.DirEntry | None) -> bool:
-            return not in_dir_condition.predicate(path, entry)
+        def match(ctx: _CandidateCtx) -> bool:
+            return not in_dir_condition._match(ctx)
 
-        return Condition(predicate, f"not in directory {directories}")
+        condition = Condition._leaf(match, f"not in directory {directories}", _COST_PATH)
+        condition._reset_caches = in_dir_condition._reset_caches
+        # Let the walker skip these directories instead of rejecting every file inside
+        condition._excluded_dirs = frozenset(
+            d for d in directories if not Path(d).is_absolute() and os.sep not in d
+        )
+        condition._key = ("not_in_directory", *in_dir_condition._key[1:])
+        return condition
 
     @staticmethod
     def path_matches(pattern: str) -> "Condition":
@@ -261,10 +1004,12 @@ class Condition:
         """
         compiled_pattern = re.compile(pattern)
 
-        def predicate(path: Path, entry: os.DirEntry | None) -> bool:
-            return compiled_pattern.search(str(path)) is not None
+        def match(ctx: _CandidateCtx) -> bool:
+            return compiled_pattern.search(ctx.path_str) is not None
 
-        return Condition(predicate, f"path matches '{pattern}'")
+        condition = Condition._leaf(match, f"path matches '{pattern}'", _COST_REGEX)
+        condition._key = ("path_matches", pattern)
+        return condition
 
     # ===== Name Conditions =====
 
@@ -280,14 +1025,38 @@ class Condition:
         Example:
             Condition.name_contains('backup')
         """
+        return Condition._name_contains_any((substring,), case_sensitive)
+
+    @staticmethod
+    def _name_contains_any(substrings: Sequence[str], case_sensitive: bool) -> "Condition":
+        """Match files whose name contains any of several substrings."""
         if not case_sensitive:
-            substring = substring.lower()
+            substrings = [substring.lower() for substring in substrings]
+        substrings = tuple(dict.fromkeys(substrings))
 
-        def predicate(path: Path, entry: os.DirEntry | None) -> bool:
-            name = path.name if case_sensitive else path.name.lower()
-            return substring in name
+        if len(substrings) == 1:
+            (substring,) = substrings
+            description = f"name contains '{substring}'"
+
+            def match(ctx: _CandidateCtx) -> bool:
+                name = ctx.name if case_sensitive else ctx.name_lower
+                return substring in name
 
-        return Condition(predicate, f"name contains '{substring}'")
+        else:
+            description = f"name contains any of {substrings}"
+
+            def match(ctx: _CandidateCtx) -> bool:
+                name = ctx.name if case_sensitive else ctx.name_lower
+                return any(substring in name for substring in substrings)
+
+        condition = Condition._leaf(match, description, _COST_NAME)
+        if case_sensitive or all(map(_folds_like_lower, substrings)):
+            condition._name_regex = "|".join(
+                _literal_regex(substring, case_sensitive) for substring in substrings
+            )
+        condition._letters = reduce(operator.and_, map(letter_mask, substrings))
+        condition._key = ("name_contains", case_sensitive, frozenset(substrings))
+        return condition
 
     @staticmethod
     def name_matches(pattern: str) -> "Condition":
@@ -300,12 +1069,30 @@ class Condition:
         Example:
             Condition.name_matches(r'^test_.*\.py$')
         """
-        compiled_pattern = re.compile(pattern)
+        search = re.compile(pattern).search
+        lowered = _literal_name_test(pattern)
 
-        def predicate(path: Path, entry: os.DirEntry | None) -> bool:
-            return compiled_pattern.search(path.name) is not None
+        if lowered is not None:
+            # Alternations of plain literals need no regex engine at all
+            name_test, literals = lowered
+
+            def match(ctx: _CandidateCtx) -> bool:
+                return name_test(ctx.name)
+
+        else:
+
+            def match(ctx: _CandidateCtx) -> bool:
+                return search(ctx.name) is not None
 
-        return Condition(predicate, f"name matches '{pattern}'")
+        cost = _COST_NAME if lowered is not None else _COST_REGEX
+        condition = Condition._leaf(match, f"name matches '{pattern}'", cost)
+        if _is_embeddable(pattern):
+            condition._name_regex = pattern
+        if lowered is not None:
+            condition._name_test = name_test
+            condition._letters = reduce(operator.and_, map(letter_mask, literals))
+        condition._key = ("name_matches", pattern)
+        return condition
 
     @staticmethod
     def name_equals(name: str, case_sensitive: bool = False) -> "Condition":
@@ -322,11 +1109,16 @@ class Condition:
         if not case_sensitive:
             name = name.lower()
 
-        def predicate(path: Path, entry: os.DirEntry | None) -> bool:
-            file_name = path.name if case_sensitive else path.name.lower()
+        def match(ctx: _CandidateCtx) -> bool:
+            file_name = ctx.name if case_sensitive else ctx.name_lower
             return file_name == name
 
-        return Condition(predicate, f"name equals '{name}'")
+        condition = Condition._leaf(match, f"name equals '{name}'", _COST_NAME)
+        if case_sensitive or _folds_like_lower(name):
+            condition._name_regex = rf"\A{_literal_regex(name, case_sensitive)}\Z"
+        condition._letters = letter_mask(name)
+        condition._key = ("name_equals", name, case_sensitive)
+        return condition
 
     # ===== Time Conditions =====
 
@@ -341,79 +1133,82 @@ class Condition:
         Example:
             Condition.modified_within_days(7)  # Modified in last week
         """
-        cutoff_time = datetime.now() - timedelta(days=days)
+        # Compare raw POSIX timestamps instead of building a datetime per file
+        cutoff_timestamp = (datetime.now() - timedelta(days=days)).timestamp()
 
-        def predicate(path: Path, entry: os.DirEntry | None) -> bool:
+        def match(ctx: _CandidateCtx) -> bool:
             try:
-                if entry and hasattr(entry, "stat"):
-                    mtime = entry.stat(follow_symlinks=False).st_mtime
-                else:
-                    mtime = path.stat().st_mtime
-                mod_time = datetime.fromtimestamp(mtime)
-                return mod_time >= cutoff_time
+                return ctx.stat().st_mtime >= cutoff_timestamp
             except (OSError, PermissionError):
                 return False
 
-        return Condition(predicate, f"modified within {days} days")
+        condition = Condition._leaf(match, f"modified within {days} days", _COST_STAT_TIME)
+        condition._batch = lambda batch: batch.stat_ok & (batch.mtimes >= cutoff_timestamp)
+        condition._key = ("modified_within_days", days)
+        return condition
 
     @staticmethod
     def created_within_days(days: int) -> "Condition":
         """
         Match files created within the last N days.
 
+        Uses the birth time where the platform reports one (macOS, BSD,
+        Windows) and the inode change time elsewhere.
+
         Args:
             days: Number of days
 
         Example:
             Condition.created_within_days(30)  # Created in last month
         """
-        cutoff_time = datetime.now() - timedelta(days=days)
+        # Compare raw POSIX timestamps instead of building a datetime per file
+        cutoff_timestamp = (datetime.now() - timedelta(days=days)).timestamp()
+        creation_time = operator.attrgetter(_batch.CREATION_TIME_FIELD)
 
-        def predicate(path: Path, entry: os.DirEntry | None) -> bool:
+        def match(ctx: _CandidateCtx) -> bool:
             try:
-                if entry and hasattr(entry, "stat"):
-                    ctime = entry.stat(follow_symlinks=False).st_ctime
-                else:
-                    ctime = path.stat().st_ctime
-                create_time = datetime.fromtimestamp(ctime)
-                return create_time >= cutoff_time
+                return creation_time(ctx.stat()) >= cutoff_timestamp
             except (OSError, PermissionError):
                 return False
 
-        return Condition(predicate, f"created within {days} days")
+        condition = Condition._leaf(match, f"created within {days} days", _COST_STAT_TIME)
+        condition._batch = lambda batch: batch.stat_ok & (batch.ctimes >= cutoff_timestamp)
+        condition._key = ("created_within_days", days)
+        return condition
 
     # ===== File Type Detection =====
 
+    # The helpers below return one shared, cached leaf per file type
+
     @staticmethod
+    @cache
     def is_image() -> "Condition":
         """Match common image file types."""
-        return Condition.extension(
-            ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".svg", ".webp", ".tiff", ".ico"
-        )
+        return Condition.extension(*sorted(_IMAGE_EXTENSIONS))
 
     @staticmethod
+    @cache
     def is_video() -> "Condition":
         """Match common video file types."""
-        return Condition.extension(
-            ".mp4", ".avi", ".mov", ".mkv", ".flv", ".wmv", ".webm", ".m4v", ".mpg", ".mpeg"
-        )
+        return Condition.extension(*sorted(_VIDEO_EXTENSIONS))
 
     @staticmethod
+    @cache
     def is_audio() -> "Condition":
         """Match common audio file types."""
-        return Condition.extension(".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma", ".m4a", ".opus")
+        return Condition.extension(*sorted(_AUDIO_EXTENSIONS))
 
     @staticmethod
+    @cache
     def is_document() -> "Condition":
         """Match common document file types."""
-        return Condition.extension(
-            ".pdf", ".doc", ".docx", ".txt", ".odt", ".rtf", ".md", ".markdown"
-        )
+        return Condition.extension(*sorted(_DOCUMENT_EXTENSIONS))
 
     @staticmethod
+    @cache
     def is_archive() -> "Condition":
         """Match common archive file types."""
-        return Condition.extension(".zip", ".tar", ".gz", ".bz2", ".7z", ".rar", ".xz", ".tgz")
+        return Condition.extension(*sorted(_ARCHIVE_EXTENSIONS))
 
 
 class FileFinder:
@@ -432,22 +1227,80 @@ class FileFinder:
         root_path: str | None = None,
         follow_symlinks: bool = False,
         max_depth: int | None = None,
+        *,
+        backend: str = "scandir",
+        traversal_order: str = "dfs",
+        cache: bool | None = None,
+        workers: int | None = None,
     ):
         """
         Initialize FileFinder.
 
         Args:
             root_path: Root directory to search from (default: current directory)
-            follow_symlinks: Whether to follow symbolic links
+            follow_symlinks: Whether to follow symbolic links. A link back to one of
+                its own ancestor directories is not entered, so link loops end
             max_depth: Maximum directory depth to search (None = unlimited)
+            backend: Directory reading backend: "scandir" (portable) or "getdents"
+                (raw getdents64 syscall on Linux, falls back to "scandir" elsewhere)
+            traversal_order: Order in which directories are visited: "dfs", "bfs", or
+                "inode" (ascending inode number, which reduces seeking on spinning
+                disks but makes result order depend on the filesystem)
+            cache: Reuse directory listings across searches while each directory's
+                mtime is unchanged (default: FILE_FINDER_ENABLE_CACHING)
+            workers: Number of threads scanning directories concurrently. None or 1
+                scans sequentially; with more, results arrive in no particular
+                order and traversal_order is ignored. Threads are only started
+                once the walk finds enough directories to keep them busy
         """
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {_BACKENDS}")
+        if backend == "getdents" and not _fastwalk.AVAILABLE:
+            logger.info("getdents64 is not available on this platform, using scandir")
+            backend = "scandir"
+        if traversal_order not in _TRAVERSAL_ORDERS:
+            raise ValueError(
+                f"Unknown traversal_order {traversal_order!r}, expected one of {_TRAVERSAL_ORDERS}"
+            )
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
         self.root_path = Path(root_path) if root_path else Path.cwd()
+        # Normalized once: the walker works on str paths, and in_directory start points
+        # are located against the root's real path
+        self._root = os.fspath(self.root_path)
+        self._real_root = Path(os.path.realpath(self._root))
+        # Walking from a real root without entering links only visits real paths,
+        # so conditions need not resolve the directories it reports
+        self._walks_real_paths = not follow_symlinks and os.fspath(self._real_root) == self._root
         self.follow_symlinks = follow_symlinks
         self.max_depth = max_depth
+        self.backend = backend
+        self.traversal_order = traversal_order
+        self.cache = config.enable_caching if cache is None else cache
+        self.workers = workers or 1
+        # The root is opened as given, even when it is a symlink. Directories below it
+        # are only entered when they were listed as real directories, and the getdents
+        # backend also opens them with O_NOFOLLOW so one swapped for a link is refused.
+        self._scandir_root = _fastwalk.scandir if backend == "getdents" else os.scandir
+        self._scandir = self._scandir_root
+        if backend == "getdents" and not follow_symlinks:
+            self._scandir = partial(_fastwalk.scandir, follow_symlinks=False)
+        if self.cache:
+            dir_cache.set_root(self._root)
+            self._scandir_root = partial(dir_cache.scandir, scandir=self._scandir_root)
+            self._scandir = partial(dir_cache.scandir, scandir=self._scandir)
 
         logger.info(
-            f"Initialized FileFinder: root={self.root_path}, "
-            f"follow_symlinks={follow_symlinks}, max_depth={max_depth}"
+            "Initialized FileFinder: root=%s, follow_symlinks=%s, max_depth=%s, backend=%s, "
+            "traversal_order=%s, cache=%s, workers=%s",
+            self.root_path,
+            follow_symlinks,
+            max_depth,
+            backend,
+            traversal_order,
+            self.cache,
+            self.workers,
         )
 
     def search(
@@ -456,7 +1309,13 @@ class FileFinder:
         recursive: bool = True,
         lazy: bool = False,
         max_results: int | None = None,
-    ) -> list[Path] | Generator[Path]:
+        preserve_order: bool = False,
+        *,
+        batch_mode: bool = False,
+        batch_size: int = _batch.DEFAULT_BATCH_SIZE,
+        with_stat: bool = False,
+        workers: int | None = None,
+    ) -> list[Path] | list[FileInfo] | Iterator[Path] | Iterator[FileInfo]:
         """
         Search for files matching the given condition.
 
@@ -465,9 +1324,19 @@ class FileFinder:
             recursive: Whether to search subdirectories
             lazy: If True, returns a generator; if False, returns a list
             max_results: Maximum number of results to return (None = unlimited)
+            preserve_order: If True, evaluate AND/OR operands in the order written
+                instead of cheapest first
+            batch_mode: Evaluate candidates in batches, comparing size and time
+                conditions as NumPy arrays (requires numpy; ignored with workers)
+            batch_size: Number of candidates per batch; a lazy search reads up to
+                this many candidates ahead of the results it yields
+            with_stat: Return FileInfo records carrying each file's size and
+                modification time from the walk's own stat, instead of bare paths
+            workers: Number of directory-scanning threads for this search only
+                (default: the finder's workers setting)
 
         Returns:
-            List of Path objects or generator yielding Path objects
+            List of Path (or FileInfo) objects, or a lazy iterator yielding them
 
         Example:
             results = finder.search(
@@ -476,91 +1345,501 @@ class FileFinder:
                 max_results=100
             )
         """
+        if max_results is not None and max_results < 0:
+            raise ValueError(f"max_results must not be negative, got {max_results}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        if workers is None:
+            workers = self.workers
+        elif workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if batch_mode and not _batch.AVAILABLE:
+            logger.info("numpy is not installed, evaluating candidates one at a time")
+            batch_mode = False
+
         logger.info(
-            f"Starting search: recursive={recursive}, lazy={lazy}, max_results={max_results}"
+            "Starting search: recursive=%s, lazy=%s, max_results=%s", recursive, lazy, max_results
         )
 
+        condition = condition._canonicalize().finalize(preserve_order)
+        plan = self._plan_traversal(condition, recursive)
+
+        candidates: Generator[_CandidateCtx]
+        if workers > 1:
+            candidates = self._walk_and_filter_parallel(condition, recursive, plan, workers)
+        elif batch_mode:
+            candidates = self._walk_and_filter_batched(condition, recursive, plan, batch_size)
+        else:
+            candidates = self._walk_and_filter(condition, recursive, plan)
+
+        matches = self._take(candidates, max_results, with_stat)
         if lazy:
-            return self._search_generator(condition, recursive, max_results)
-        results = list(self._search_generator(condition, recursive, max_results))
-        logger.info(f"Search completed: found {len(results)} files")
+            return matches
+        results = list(matches)
+        logger.info("Search completed: found %d files", len(results))
         return results
 
-    def _search_generator(
+    async def asearch(
         self,
         condition: Condition,
+        recursive: bool = True,
+        max_results: int | None = None,
+        preserve_order: bool = False,
+        *,
+        batch_mode: bool = False,
+        batch_size: int = _batch.DEFAULT_BATCH_SIZE,
+        with_stat: bool = False,
+        workers: int | None = None,
+    ) -> AsyncGenerator[Path] | AsyncGenerator[FileInfo]:
+        """
+        Search for files from asyncio code, yielding each match as the walk finds it.
+
+        The walk is a lazy search() advanced on a dedicated thread, so the event
+        loop keeps running while directories are read, and callers can start
+        on the first results (e.g. stream a response) before the walk ends.
+        Stopping iteration early (or closing the generator) shuts the walk down.
+
+        Args:
+            condition: Condition object defining the search criteria
+            recursive: Whether to search subdirectories
+            max_results: Maximum number of results to return (None = unlimited)
+            preserve_order: If True, evaluate AND/OR operands in the order written
+            batch_mode: Evaluate candidates in batches (see search)
+            batch_size: Number of candidates per batch
+            with_stat: Yield FileInfo records instead of bare paths
+            workers: Number of directory-scanning threads for this search
+
+        Yields:
+            Path (or FileInfo) objects for matching files
+
+        Example:
+            async for path in finder.asearch(Condition.extension('.log')):
+                await upload(path)
+        """
+        loop = asyncio.get_running_loop()
+        # One thread runs every step of the walk, in order, including its final close
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="file_finder_async")
+        search = partial(
+            self.search,
+            condition,
+            recursive,
+            True,
+            max_results,
+            preserve_order,
+            batch_mode=batch_mode,
+            batch_size=batch_size,
+            with_stat=with_stat,
+            workers=workers,
+        )
+        matches = None
+        try:
+            matches = await loop.run_in_executor(executor, search)
+            while (match := await loop.run_in_executor(executor, next, matches, None)) is not None:
+                yield match
+        finally:
+            try:
+                if matches is not None:
+                    await loop.run_in_executor(executor, matches.close)
+            finally:
+                executor.shutdown(wait=False)
+
+    @staticmethod
+    def _take(
+        candidates: Generator[_CandidateCtx], max_results: int | None, with_stat: bool
+    ) -> Generator[Path] | Generator[FileInfo]:
+        """
+        Yield up to max_results results, then shut the walk down.
+
+        The walk is closed as soon as the last result is taken (or the caller
+        closes a lazy search), so its open directories and worker threads are
+        released right away rather than whenever the generator is collected.
+        """
+        try:
+            matches = (
+                FileFinder._file_infos(candidates)
+                if with_stat
+                else (ctx.path for ctx in candidates)
+            )
+            yield from islice(matches, max_results)
+        finally:
+            candidates.close()
+
+    @staticmethod
+    def _file_infos(candidates: Iterator[_CandidateCtx]) -> Generator[FileInfo]:
+        """Build FileInfo records from matched candidates, reusing their stat results."""
+        for ctx in candidates:
+            try:
+                st = ctx.stat()
+            except OSError as e:
+                # Gone or unreadable since it matched, so there is nothing to report
+                logger.debug("Cannot stat match %s: %s", ctx.path_str, e)
+                continue
+            yield FileInfo(ctx.path, st.st_size, st.st_mtime_ns, stat.S_ISDIR(st.st_mode))
+
+    def _plan_traversal(self, condition: Condition, recursive: bool) -> _TraversalPlan:
+        """
+        Turn the directory hints of a condition into a traversal plan.
+
+        Subdirectories named by an AND-ed ``not_in_directory`` are pruned. An
+        AND-ed ``in_directory`` with absolute paths inside the root starts the
+        walk at those directories instead of scanning their siblings; it is only
+        used without symlink following, where a file's location under the root
+        is its real location.
+        """
+        excluded_dirs, start_dirs = condition._traversal_hints()
+        starts = ((self._root, 0),)
+        if start_dirs and recursive and not self.follow_symlinks:
+            starts = self._start_points(start_dirs) or starts
+        if excluded_dirs:
+            logger.debug("Pruning directories named: %s", sorted(excluded_dirs))
+        loop_guard = _LoopGuard(self._root) if self.follow_symlinks and recursive else None
+        return _TraversalPlan(starts, excluded_dirs, loop_guard)
+
+    def _start_points(self, start_dirs: tuple[Path, ...]) -> tuple[tuple[str, int], ...]:
+        """
+        Map resolved start directories onto (path under root, depth) pairs.
+
+        Returns:
+            The start points, or an empty tuple if any directory lies outside the root
+        """
+        root = self._real_root
+        kept: list[Path] = []
+        starts: list[tuple[str, int]] = []
+        # Sorted input puts parents before children, so nested directories are dropped
+        for start_dir in sorted(start_dirs):
+            if not start_dir.is_relative_to(root):
+                return ()
+            if any(start_dir.is_relative_to(parent) for parent in kept):
+                continue
+            kept.append(start_dir)
+            relative = start_dir.relative_to(root)
+            starts.append((os.fspath(self.root_path / relative), len(relative.parts)))
+        return tuple(starts)
+
+    def _walk_and_filter(
+        self, condition: Condition, recursive: bool, plan: _TraversalPlan
+    ) -> Generator[_CandidateCtx]:
+        """
+        Stream matching files straight from the walker without buffering.
+
+        This is the per-entry hot loop, so everything it touches is bound to a
+        local up front and single-leaf conditions skip the tree dispatch.
+        """
+        name_matcher = condition.compile_name_matcher()
+        letters = condition._required_letters() if self.cache else 0
+        evaluate = condition.compile_evaluator()
+        follow_symlinks = self.follow_symlinks
+        real_paths = self._walks_real_paths
+        new_ctx = _CandidateCtx
+
+        for entry, directory in self._iter_entries(plan, recursive):
+            # Cached entries carry their name's letter mask: one AND rejects most names
+            if letters and (entry.letter_mask & letters) != letters:
+                continue
+            # Reject on the fused name regex before building a candidate context
+            if name_matcher is not None and not name_matcher(entry.name):
+                continue
+
+            # One context per candidate so chained predicates share its stat result
+            ctx = new_ctx(entry, follow_symlinks, _parent=directory, _parent_is_real=real_paths)
+            if evaluate(ctx):
+                logger.debug("Match found: %s", ctx.path_str)
+                yield ctx
+
+    def _walk_and_filter_batched(
+        self, condition: Condition, recursive: bool, plan: _TraversalPlan, batch_size: int
+    ) -> Generator[_CandidateCtx]:
+        """Collect candidates into batches and evaluate each batch with NumPy."""
+        name_matcher = condition.compile_name_matcher()
+        letters = condition._required_letters() if self.cache else 0
+        follow_symlinks = self.follow_symlinks
+        real_paths = self._walks_real_paths
+        new_ctx = _CandidateCtx
+        ctxs: list[_CandidateCtx] = []
+
+        for entry, directory in self._iter_entries(plan, recursive):
+            if letters and (entry.letter_mask & letters) != letters:
+                continue
+            if name_matcher is not None and not name_matcher(entry.name):
+                continue
+            ctxs.append(
+                new_ctx(entry, follow_symlinks, _parent=directory, _parent_is_real=real_paths)
+            )
+            if len(ctxs) >= batch_size:
+                yield from self._filter_batch(condition, ctxs)
+                ctxs = []
+        if ctxs:
+            yield from self._filter_batch(condition, ctxs)
+
+    @staticmethod
+    def _filter_batch(condition: Condition, ctxs: list[_CandidateCtx]) -> Iterator[_CandidateCtx]:
+        """Return the candidates in a batch that satisfy the condition."""
+        matched = condition.evaluate_batch(_batch.CandidateBatch(ctxs))
+        return compress(ctxs, matched)
+
+    def _walk_and_filter_parallel(
+        self, condition: Condition, recursive: bool, plan: _TraversalPlan, workers: int
+    ) -> Generator[_CandidateCtx]:
+        """
+        Scan directories on a thread pool and stream matches back to the caller.
+
+        Each task lists one directory, evaluates the condition on its files and
+        submits the subdirectories it finds as new tasks. Matches come back through
+        a queue, one batch per directory. scandir and stat release the GIL, so the
+        workers overlap their syscall latency.
+
+        The walk starts breadth-first on the calling thread and only hands the
+        remaining directories to a pool once at least _PARALLEL_MIN_DIRS of them
+        are pending, so small trees never pay for starting threads.
+        """
+        name_matcher = condition.compile_name_matcher()
+        letters = condition._required_letters() if self.cache else 0
+        evaluate = condition.compile_evaluator()
+        follow_symlinks = self.follow_symlinks
+        real_paths = self._walks_real_paths
+
+        def match_files(files: list[os.DirEntry], directory: str) -> list[_CandidateCtx]:
+            matches = []
+            for entry in files:
+                if letters and (entry.letter_mask & letters) != letters:
+                    continue
+                if name_matcher is not None and not name_matcher(entry.name):
+                    continue
+                ctx = _CandidateCtx(
+                    entry, follow_symlinks, _parent=directory, _parent_is_real=real_paths
+                )
+                if evaluate(ctx):
+                    matches.append(ctx)
+            return matches
+
+        frontier = deque(plan.starts)
+        while frontier and len(frontier) < _PARALLEL_MIN_DIRS:
+            directory, depth = frontier.popleft()
+            matches, subdirs = self._scan_directory(directory, depth, recursive, plan, match_files)
+            frontier.extend((subdir.path, depth + 1) for subdir in subdirs)
+            yield from matches
+        if frontier:
+            yield from self._scan_in_pool(frontier, match_files, recursive, plan, workers)
+
+    def _scan_in_pool(
+        self,
+        frontier: deque[tuple[str, int]],
+        match_files: Callable[[list[os.DirEntry], str], list[_CandidateCtx]],
         recursive: bool,
-        max_results: int | None,
-    ) -> Generator[Path]:
-        """Internal generator for file searching."""
-        count = 0
-
-        for file_path in self._walk_directory(self.root_path, recursive, current_depth=0):
-            # Check if we've reached max results
-            if max_results is not None and count >= max_results:
-                logger.debug(f"Reached max_results limit: {max_results}")
-                break
-
-            # Evaluate condition
-            if condition.evaluate(file_path):
-                logger.debug(f"Match found: {file_path}")
-                yield file_path
-                count += 1
-
-    def _walk_directory(
+        plan: _TraversalPlan,
+        workers: int,
+    ) -> Generator[_CandidateCtx]:
+        """Scan the frontier's directories and everything below them on a thread pool."""
+        results: queue.SimpleQueue = queue.SimpleQueue()
+        stop = threading.Event()
+        lock = threading.Lock()
+        pending = len(frontier)
+
+        def scan(directory: str, depth: int) -> None:
+            nonlocal pending
+            try:
+                if stop.is_set():
+                    return
+                matches, subdirs = self._scan_directory(
+                    directory, depth, recursive, plan, match_files
+                )
+                with lock:
+                    pending += len(subdirs)
+                for subdir in subdirs:
+                    executor.submit(scan, subdir.path, depth + 1)
+
+                if matches:
+                    results.put(matches)
+            except Exception as e:
+                # Hand errors (e.g. from user predicates) to the consuming thread
+                results.put(e)
+            finally:
+                with lock:
+                    pending -= 1
+                    finished = pending == 0
+                if finished:
+                    results.put(_SCAN_DONE)
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="file_finder")
+        for directory, depth in frontier:
+            executor.submit(scan, directory, depth)
+        try:
+            while (batch := results.get()) is not _SCAN_DONE:
+                if isinstance(batch, Exception):
+                    raise batch
+                yield from batch
+        finally:
+            # Also reached when the consumer stops early (e.g. max_results)
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _scan_directory(
         self,
-        directory: Path,
+        directory: str,
+        depth: int,
         recursive: bool,
-        current_depth: int,
-    ) -> Generator[Path]:
+        plan: _TraversalPlan,
+        match_files: Callable[[list[os.DirEntry], str], list[_CandidateCtx]],
+    ) -> tuple[list[_CandidateCtx], list[os.DirEntry]]:
         """
-        Walk directory tree efficiently using os.scandir.
+        List one directory, returning its matching files and subdirectories to descend into.
+
+        Files are matched before the directory is closed, so entries from the
+        getdents backend stat relative to the open directory descriptor.
+
+        Returns:
+            (matches, subdirectories); both empty if the directory is beyond
+            max_depth or cannot be read
+        """
+        subdirs: list[os.DirEntry] = []
+        listing = self._open_listing(directory, depth, plan)
+        if listing is None:
+            return [], subdirs
+
+        descend = recursive and (self.max_depth is None or depth < self.max_depth)
+        files: list[os.DirEntry] = []
+        with listing as entries:
+            try:
+                files.extend(self._classify_entries(entries, descend, plan.excluded_dirs, subdirs))
+            except (OSError, PermissionError) as e:
+                logger.warning("Cannot access directory %s: %s", directory, e)
+            return match_files(files, directory), subdirs
+
+    def _iter_entries(
+        self,
+        plan: _TraversalPlan,
+        recursive: bool,
+    ) -> Generator[tuple[os.DirEntry, str]]:
+        """
+        Walk the directory tree efficiently using os.scandir and an explicit frontier.
+
+        Pending directories are visited depth-first, breadth-first, or in ascending
+        inode order depending on ``traversal_order``. Subdirectories named in the
+        plan's excluded set are never opened.
 
         Args:
-            directory: Directory to walk
-            recursive: Whether to recurse into subdirectories
-            current_depth: Current recursion depth
+            plan: Start directories and excluded directory names for this walk
+            recursive: Whether to descend into subdirectories
 
         Yields:
-            Path objects for each file found
+            (DirEntry, directory) tuples for each file found, where directory is
+            the path of the listed directory the file came from
         """
-        # Check depth limit
-        if self.max_depth is not None and current_depth > self.max_depth:
-            logger.debug(f"Reached max_depth at: {directory}")
-            return
-
-        logger.debug(f"Scanning directory: {directory} (depth={current_depth})")
+        frontier, pop = self._new_frontier(plan.starts)
+        excluded_dirs = plan.excluded_dirs
+        max_depth = self.max_depth
+
+        while frontier:
+            _inode, directory, depth = pop()
+            listing = self._open_listing(directory, depth, plan)
+            if listing is None:
+                continue
+
+            subdirs: list[os.DirEntry] = []
+            # Subdirectories of the deepest level would never be scanned, so don't classify them
+            descend = recursive and (max_depth is None or depth < max_depth)
+            try:
+                with listing as entries:
+                    for entry in self._classify_entries(entries, descend, excluded_dirs, subdirs):
+                        yield entry, directory
+            except (OSError, PermissionError) as e:
+                # Skip directories we can't access
+                logger.warning("Cannot access directory %s: %s", directory, e)
+                continue
+
+            self._push_subdirs(frontier, subdirs, depth + 1)
+
+    def _open_listing(
+        self, directory: str, depth: int, plan: _TraversalPlan
+    ) -> AbstractContextManager[Iterable[os.DirEntry]] | None:
+        """
+        Open a directory for listing, shared by the sequential and parallel walkers.
 
+        Returns:
+            The listing, to be used in a ``with`` statement, or None if the
+            directory is beyond max_depth, loops back to an ancestor, or cannot be opened
+        """
+        if self.max_depth is not None and depth > self.max_depth:
+            logger.debug("Reached max_depth at: %s", directory)
+            return None
+        if plan.loop_guard is not None and plan.loop_guard.is_loop(directory):
+            logger.debug("Skipping link back to an ancestor directory: %s", directory)
+            return None
+
+        logger.debug("Scanning directory: %s (depth=%d)", directory, depth)
         try:
-            with os.scandir(directory) as entries:
-                # Separate files and directories for efficient processing
-                files = []
-                dirs = []
-
-                for entry in entries:
-                    try:
-                        # Skip symlinks if not following them
-                        if entry.is_symlink() and not self.follow_symlinks:
-                            continue
-
-                        if entry.is_file(follow_symlinks=self.follow_symlinks):
-                            files.append(entry)
-                        elif entry.is_dir(follow_symlinks=self.follow_symlinks) and recursive:
-                            dirs.append(entry)
-                    except (OSError, PermissionError):
-                        # Skip files/directories we can't access
-                        continue
-
-                # Yield all files in current directory
-                for entry in files:
-                    yield Path(entry.path)
-
-                # Recurse into subdirectories
-                for entry in dirs:
-                    yield from self._walk_directory(
-                        Path(entry.path), recursive=True, current_depth=current_depth + 1
-                    )
-
+            return (self._scandir if depth else self._scandir_root)(directory)
         except (OSError, PermissionError) as e:
             # Skip directories we can't access
-            logger.warning(f"Cannot access directory {directory}: {e}")
+            logger.warning("Cannot access directory %s: %s", directory, e)
+            return None
+
+    def _classify_entries(
+        self,
+        entries: Iterable[os.DirEntry],
+        descend: bool,
+        excluded_dirs: frozenset[str],
+        subdirs: list[os.DirEntry],
+    ) -> Generator[os.DirEntry]:
+        """
+        Yield the files of a directory listing, collecting the subdirectories to descend into.
+
+        Symlinks are skipped unless followed, and subdirectories are only
+        classified when ``descend`` is set and their name is not excluded.
+        Entries that cannot be inspected are skipped; errors reading the listing
+        itself propagate to the caller.
+        """
+        follow_symlinks = self.follow_symlinks
+        for entry in entries:
+            try:
+                # Skip symlinks if not following them
+                if not follow_symlinks and entry.is_symlink():
+                    continue
+
+                is_file = entry.is_file(follow_symlinks=follow_symlinks)
+                if not is_file and (
+                    descend
+                    # A followed link's files resolve outside the excluded name
+                    and (
+                        entry.name not in excluded_dirs or (follow_symlinks and entry.is_symlink())
+                    )
+                    and entry.is_dir(follow_symlinks=follow_symlinks)
+                ):
+                    subdirs.append(entry)
+            except (OSError, PermissionError):
+                # Skip files/directories we can't access
+                continue
+            if is_file:
+                yield entry
+
+    def _new_frontier(
+        self, starts: tuple[tuple[str, int], ...]
+    ) -> tuple[list | deque, Callable[[], tuple]]:
+        """
+        Create the pending-directory container for the configured traversal order.
+
+        Items are (inode, directory, depth) tuples; the inode only matters for
+        "inode" order, where the container is a min-heap.
+
+        Returns:
+            The frontier and the function that pops its next directory
+        """
+        items = [(0, start, depth) for start, depth in starts]
+        if self.traversal_order == "inode":
+            heapq.heapify(items)
+            return items, partial(heapq.heappop, items)
+        # Reversed so that depth-first order pops the first start directory first
+        queue = deque(reversed(items) if self.traversal_order == "dfs" else items)
+        return queue, queue.popleft if self.traversal_order == "bfs" else queue.pop
+
+    def _push_subdirs(self, frontier: list | deque, subdirs: list[os.DirEntry], depth: int) -> None:
+        """Add newly discovered subdirectories to the frontier."""
+        if self.traversal_order == "inode":
+            # Visiting directories by ascending inode keeps reads roughly sequential on HDDs
+            for subdir in subdirs:
+                heapq.heappush(frontier, (subdir.inode(), subdir.path, depth))
+        elif self.traversal_order == "bfs":
+            frontier.extend((0, subdir.path, depth) for subdir in subdirs)
+        else:
+            # Push in reverse so subdirectories are visited in scandir order
+            frontier.extend((0, subdir.path, depth) for subdir in reversed(subdirs))
@@ -60,7 +60,9 @@ def sample_files(temp_dir: Path) -> Path:
     # Subdirectory 3
     subdir3 = temp_dir / "subdir3"
     subdir3.mkdir()
-    (subdir3 / "large_file.dat").write_text("x" * (2 * 1024 * 1024))  # 2MB
+    # Only the size matters, so allocate it sparsely instead of writing 2MB per test
+    with (subdir3 / "large_file.dat").open("wb") as f:
+        f.truncate(2 * 1024 * 1024)
     (subdir3 / "backup.bak").write_text("x" * 100)
 
     return temp_dir
@@ -0,0 +1,100 @@
+"""Tests for NumPy batch evaluation."""
+
+import pytest
+
+from file_finder import Condition, FileFinder, _batch
+from file_finder.core import _CandidateCtx
+
+np = pytest.importorskip("numpy")
+
+CONDITIONS = [
+    Condition.size_greater_than(100),
+    Condition.size_between(100, 300).AND(Condition.modified_within_days(1)),
+    Condition.extension(".txt").AND(Condition.size_less_than(200)),
+    Condition.extension(".png").OR(Condition.size_greater_than(1024)),
+    Condition.name_contains("file").AND(
+        Condition.size_less_than(100).OR(Condition.created_within_days(1))
+    ),
+]
+
+
+class TestBatchSearch:
+    """Test FileFinder.search with batch_mode."""
+
+    @pytest.mark.parametrize("condition", CONDITIONS, ids=lambda c: c.description)
+    @pytest.mark.parametrize("batch_size", [1, 3, 4096])
+    def test_matches_per_file_search(self, sample_files, condition, batch_size):
+        """Test that batched evaluation finds the same files in the same order."""
+        finder = FileFinder(root_path=str(sample_files))
+        expected = finder.search(condition)
+        assert finder.search(condition, batch_mode=True, batch_size=batch_size) == expected
+
+    def test_lazy_max_results(self, sample_files):
+        """Test that a lazy batched search still honours max_results."""
+        finder = FileFinder(root_path=str(sample_files))
+        results = finder.search(
+            Condition.size_less_than(1024), lazy=True, max_results=2, batch_mode=True
+        )
+        assert len(list(results)) == 2
+
+    def test_invalid_batch_size(self, sample_files):
+        """Test that a non-positive batch size is rejected."""
+        finder = FileFinder(root_path=str(sample_files))
+        with pytest.raises(ValueError, match="batch_size"):
+            finder.search(Condition.size_less_than(1024), batch_mode=True, batch_size=0)
+
+    def test_falls_back_without_numpy(self, sample_files, monkeypatch):
+        """Test that batch_mode without NumPy evaluates candidates one at a time."""
+        monkeypatch.setattr(_batch, "AVAILABLE", False)
+        finder = FileFinder(root_path=str(sample_files))
+        results = finder.search(Condition.size_greater_than(1024 * 1024), batch_mode=True)
+        assert [f.name for f in results] == ["large_file.dat"]
+
+
+class TestEvaluateBatch:
+    """Test Condition.evaluate_batch directly."""
+
+    def test_unstattable_rows_do_not_match(self, temp_dir):
+        """Test that stat failures count as non-matches, like per-file evaluation."""
+        (temp_dir / "real.txt").write_text("x" * 10)
+        ctxs = [
+            _CandidateCtx(None, _path=temp_dir / "real.txt"),
+            _CandidateCtx(None, _path=temp_dir / "missing.txt"),
+        ]
+        batch = _batch.CandidateBatch(ctxs)
+        matched = Condition.size_less_than(100).evaluate_batch(batch)
+        assert matched.tolist() == [True, False]
+
+    def test_fallback_skips_decided_rows(self, temp_dir):
+        """Test that per-row predicates only run on rows an AND has not rejected."""
+        (temp_dir / "small.txt").write_text("x")
+        (temp_dir / "big.txt").write_text("x" * 1000)
+        seen = []
+
+        def predicate(path, entry):
+            seen.append(path.name)
+            return True
+
+        ctxs = [_CandidateCtx(None, _path=temp_dir / name) for name in ("small.txt", "big.txt")]
+        condition = Condition.size_greater_than(100).AND(Condition(predicate, "record"))
+        matched = condition.finalize().evaluate_batch(_batch.CandidateBatch(ctxs))
+        assert matched.tolist() == [False, True]
+        assert seen == ["big.txt"]
+
+    def test_builds_only_columns_in_use(self, sample_files):
+        """Test that a size-only condition never builds the time columns."""
+        ctxs = [_CandidateCtx(None, _path=path) for path in sample_files.iterdir()]
+        batch = _batch.CandidateBatch(ctxs)
+        Condition.size_greater_than(100).finalize().evaluate_batch(batch)
+        assert set(batch._columns) == {"stat_ok", "st_size"}
+
+    def test_stats_only_open_rows(self, sample_files):
+        """Test that rows rejected by an earlier AND operand are never stat'ed."""
+        ctxs = [
+            _CandidateCtx(None, _path=sample_files / name) for name in ("file1.txt", "file2.py")
+        ]
+        batch = _batch.CandidateBatch(ctxs)
+        condition = Condition.extension(".txt").AND(Condition.size_less_than(1000))
+        assert condition.finalize().evaluate_batch(batch).tolist() == [True, False]
+        assert batch.stat_ok.tolist() == [True, False]
+        assert ctxs[1]._stat_cache is None
@@ -1,6 +1,14 @@
 """Tests for Condition class."""
 
-from file_finder import Condition
+import os
+import re
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from file_finder import Condition, ConditionOperator, FileFinder, config, core
 
 
 class TestConditionExtension:
@@ -34,6 +42,37 @@ class TestConditionExtension:
         txt_files = [f for f in sample_files.rglob("*") if f.is_file() and condition.evaluate(f)]
         assert len(txt_files) == 3
 
+    def test_many_extensions(self, sample_files):
+        """Test that large extension sets follow the same rules as small ones."""
+        extensions = [f".x{i}" for i in range(100)] + [".TXT", ".py"]
+        condition = Condition.extension(*extensions)
+        files = [f for f in sample_files.rglob("*") if f.is_file() and condition.evaluate(f)]
+        assert len(files) == 4
+        assert not condition.evaluate(Path(".txt"))
+        assert not condition.evaluate(Path("file."))
+
+    def test_repeated_calls_share_a_leaf(self):
+        """Test that the same extension arguments return one shared leaf."""
+        assert Condition.extension(".py", ".md") is Condition.extension(".py", ".md")
+        assert Condition.extension(".py") is not Condition.extension(".md")
+
+    def test_extension_follows_suffix_rules(self):
+        """Test that dotfiles and trailing dots have no extension, like Path.suffix."""
+        condition = Condition.extension("bashrc", "")
+        assert not condition.evaluate(Path(".bashrc"))
+        assert not condition.evaluate(Path("file."))
+        assert Condition.extension(".GZ").evaluate(Path("archive.tar.gz"))
+        assert not Condition.extension(".tar.gz").evaluate(Path("archive.tar.gz"))
+        assert Condition.extension(".png").evaluate(Path(".hidden.png"))
+        assert not Condition.extension(".png").evaluate(Path(".png"))
+
+    def test_extension_prefilter_skips_unmatchable_suffixes(self):
+        """Test that the name prefilter only admits suffixes the leaf can match."""
+        matcher = Condition.extension(".py", ".tar.gz").compile_name_matcher()
+        assert matcher("core.PY")
+        assert not matcher("archive.tar.gz")
+        assert not Condition.extension(".tar.gz").compile_name_matcher()("archive.tar.gz")
+
 
 class TestConditionSize:
     """Test size-based conditions."""
@@ -69,6 +108,22 @@ class TestConditionSize:
         files = [f for f in temp_dir.iterdir() if condition.evaluate(f)]
         assert len(files) == 3  # All three files should match
 
+    def test_size_of_symlink_follows_config(self, temp_dir, monkeypatch):
+        """Test that evaluating a bare path stats links per default_follow_symlinks."""
+        target = temp_dir / "target.dat"
+        target.write_text("x" * 5000)
+        link = temp_dir / "link.dat"
+        try:
+            link.symlink_to(target)
+        except OSError:
+            pytest.skip("Cannot create symlinks on this system")
+
+        condition = Condition.size_greater_than(1000)
+        monkeypatch.setattr(core, "config", replace(config, default_follow_symlinks=False))
+        assert not condition.evaluate(link)
+        monkeypatch.setattr(core, "config", replace(config, default_follow_symlinks=True))
+        assert condition.evaluate(link)
+
 
 class TestConditionLocation:
     """Test location-based conditions."""
@@ -80,6 +135,14 @@ class TestConditionLocation:
         # file3.txt, video.mp4, deep_file.txt (all in or under subdir1)
         assert len(files) == 3
 
+    def test_in_directory_name_matches_whole_components(self, sample_files):
+        """Test that a directory name only matches a complete path component."""
+        deep_file = sample_files / "subdir1" / "subdir2" / "deep_file.txt"
+        assert Condition.in_directory("subdir2").evaluate(deep_file)
+        assert not Condition.in_directory("subdir").evaluate(deep_file)
+        assert not Condition.in_directory("dir2").evaluate(deep_file)
+        assert not Condition.in_directory("subdir1/subdir2").evaluate(deep_file)
+
     def test_in_directory_by_path(self, sample_files):
         """Test matching files in directory by absolute path."""
         subdir1 = sample_files / "subdir1"
@@ -89,6 +152,52 @@ class TestConditionLocation:
         # file3.txt, video.mp4, deep_file.txt
         assert len(files) == 3, f"Expected 3 files in {subdir1}, got {len(files)}: {files}"
 
+    def test_in_directory_resolves_each_parent_once(self, sample_files, monkeypatch):
+        """Test that files sharing a directory reuse its resolved path."""
+        resolved = []
+        realpath = os.path.realpath
+
+        def counting_realpath(path, **kwargs):
+            resolved.append(path)
+            return realpath(path, **kwargs)
+
+        condition = Condition.in_directory(str(sample_files / "subdir1"))
+        monkeypatch.setattr(os.path, "realpath", counting_realpath)
+        files = [sample_files / name for name in ("file1.txt", "file2.py", "image.png")]
+        assert not any(condition.evaluate(f) for f in files)
+        assert resolved == [str(sample_files)]
+
+    def test_in_directory_resolves_parents_again_per_search(self, sample_files, temp_dir):
+        """Test that a reused condition sees a directory symlink retargeted between searches."""
+        root = temp_dir / "root"
+        root.mkdir()
+        link = root / "current"
+        try:
+            link.symlink_to(sample_files / "subdir1", target_is_directory=True)
+        except OSError:
+            pytest.skip("Cannot create symlinks on this system")
+        # Walking through a symlinked root makes every parent need resolving
+        walk_root = temp_dir / "walk"
+        walk_root.symlink_to(root, target_is_directory=True)
+        finder = FileFinder(root_path=str(walk_root), follow_symlinks=True)
+        condition = Condition.in_directory(str(sample_files / "subdir1")).AND(
+            Condition.extension(".txt")
+        )
+        assert {f.name for f in finder.search(condition)} == {"file3.txt", "deep_file.txt"}
+
+        link.unlink()
+        link.symlink_to(sample_files / "subdir3", target_is_directory=True)
+        (sample_files / "subdir3" / "other.txt").write_text("x")
+        assert finder.search(condition) == []
+
+    def test_in_directory_follows_symlinked_file(self, sample_files):
+        """Test that a symlinked file counts as being where its target lives."""
+        link = sample_files / "link.txt"
+        link.symlink_to(sample_files / "subdir1" / "file3.txt")
+        condition = Condition.in_directory(str(sample_files / "subdir1"))
+        assert condition.evaluate(link)
+        assert not condition.evaluate(sample_files / "file1.txt")
+
     def test_not_in_directory(self, sample_files):
         """Test excluding files from directory."""
         condition = Condition.not_in_directory("subdir1")
@@ -104,6 +213,21 @@ class TestConditionLocation:
         assert len(files) > 0
         assert all("subdir" in str(f) for f in files)
 
+    @pytest.mark.parametrize(
+        "factory", [Condition.path_matches, Condition.name_matches], ids=lambda f: f.__name__
+    )
+    def test_regex_compiled_once(self, sample_files, monkeypatch, factory):
+        """Test that regex leaves compile at construction and never touch the re cache."""
+        condition = factory(r"(?:subdir|file)\d")
+        files = [f for f in sample_files.rglob("*") if f.is_file()]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("regex compiled during evaluation")
+
+        for name in ("compile", "search", "match"):
+            monkeypatch.setattr(re, name, fail)
+        assert any(condition.evaluate(f) for f in files)
+
 
 class TestConditionName:
     """Test name-based conditions."""
@@ -150,6 +274,43 @@ class TestConditionName:
         # file1.txt, file3.txt
         assert len(files) == 2
 
+    @pytest.mark.parametrize(
+        "condition",
+        [
+            Condition.extension(".TXT"),
+            Condition.name_contains("FILE"),
+            Condition.name_equals("File1.txt"),
+            Condition.name_matches(r"^file\d"),
+            Condition.name_matches(r"e\d\.t"),
+        ],
+        ids=lambda condition: condition.description,
+    )
+    def test_name_predicates_use_entry_name(self, sample_files, condition):
+        """Test that name predicates read DirEntry.name and never build a Path."""
+        with os.scandir(sample_files) as entries:
+            entry = next(e for e in entries if e.name == "file1.txt")
+        ctx = core._CandidateCtx(entry)
+        assert condition._match(ctx)
+        assert ctx._path is None
+
+    def test_case_insensitive_leaves_lower_name_once(self, sample_files, monkeypatch):
+        """Test that chained case-insensitive name leaves share one lower-cased name."""
+        reads = []
+        name_property = core._CandidateCtx.name
+
+        def recording_name(ctx):
+            reads.append(ctx)
+            return name_property.fget(ctx)
+
+        monkeypatch.setattr(core._CandidateCtx, "name", property(recording_name))
+        condition = (
+            Condition.extension(".TXT")
+            .AND(Condition.name_contains("FILE"))
+            .AND(Condition.name_equals("File1.Txt"))
+        )
+        assert condition.evaluate(sample_files / "file1.txt")
+        assert len(reads) == 1
+
 
 class TestConditionTime:
     """Test time-based conditions."""
@@ -168,6 +329,24 @@ class TestConditionTime:
         # All files were just created
         assert len(files) == 9
 
+    def test_created_within_days_reads_creation_field(self, sample_files, monkeypatch):
+        """Test that created_within_days reads the platform's creation-time field."""
+        old = sample_files / "file1.txt"
+        two_days_ago = time.time() - 2 * 24 * 3600
+        os.utime(old, (two_days_ago, two_days_ago))
+        # Stand in for a birth-time field with one the test can set
+        monkeypatch.setattr(core._batch, "CREATION_TIME_FIELD", "st_mtime")
+        assert not Condition.created_within_days(1).evaluate(old)
+        assert Condition.created_within_days(1).evaluate(sample_files / "file2.py")
+
+    def test_modified_within_days_rejects_old_files(self, sample_files):
+        """Test that files older than the cutoff do not match."""
+        old = sample_files / "file1.txt"
+        two_days_ago = time.time() - 2 * 24 * 3600
+        os.utime(old, (two_days_ago, two_days_ago))
+        assert not Condition.modified_within_days(1).evaluate(old)
+        assert Condition.modified_within_days(3).evaluate(old)
+
 
 class TestConditionTypeDetection:
     """Test file type detection helpers."""
@@ -193,6 +372,17 @@ class TestConditionTypeDetection:
         # document.pdf and all .txt files
         assert len(files) == 4
 
+    def test_type_helpers_are_cached(self, sample_files):
+        """Test that each helper returns one shared leaf that still chains correctly."""
+        assert Condition.is_image() is Condition.is_image()
+        assert Condition.is_video() is not Condition.is_image()
+
+        finder = FileFinder(root_path=str(sample_files))
+        media = Condition.is_image().OR(Condition.is_video())
+        small_images = Condition.is_image().AND(Condition.size_less_than(100))
+        assert {f.name for f in finder.search(media)} == {"image.png", "video.mp4"}
+        assert {f.name for f in finder.search(small_images)} == {"image.png"}
+
 
 class TestConditionChaining:
     """Test chaining conditions with AND/OR."""
@@ -241,3 +431,414 @@ class TestConditionChaining:
         files = [f for f in sample_files.rglob("*") if f.is_file() and condition.evaluate(f)]
         # file1.txt (100), file3.txt (300), deep_file.txt (75)
         assert len(files) == 3
+
+    def test_chained_operands_evaluate_as_one_node(self):
+        """Test that a chain of ANDs builds one n-ary node over its leaves."""
+        leaves = [
+            Condition.extension(".txt"),
+            Condition.name_contains("a"),
+            Condition.size_less_than(10),
+        ]
+        first = leaves[0].AND(leaves[1])
+        condition = first.AND(leaves[2])
+        assert condition.children == tuple(leaves)
+        assert first.children == tuple(leaves[:2])
+        assert condition.description == (
+            "(extension in ('.txt',) AND name contains 'a' AND size < 10 bytes)"
+        )
+        mixed = leaves[0].AND(leaves[1]).OR(leaves[2])
+        assert len(mixed.children) == 2
+
+    def test_long_chain_searches(self, sample_files):
+        """Test that chaining thousands of operands neither recurses nor slows down."""
+        condition = Condition.extension(".txt")
+        for n in range(5000):
+            condition = condition.AND(Condition.size_less_than(10_000 + n))
+        assert len(condition.children) == 5001
+        results = FileFinder(root_path=str(sample_files)).search(condition)
+        assert {r.name for r in results} == {"file1.txt", "file3.txt", "deep_file.txt"}
+
+    def test_long_or_chain_is_not_nested(self, sample_files):
+        """Test that canonicalizing, finalizing and compiling a long chain does not recurse."""
+        condition = Condition.size_between(0, 0)
+        for n in range(1, 1500):
+            condition = condition.OR(Condition.size_between(n * 1000, n * 1000))
+        condition = condition.OR(Condition.size_between(75, 75))
+        canonical = condition._canonicalize().finalize(preserve_order=True)
+        assert len(canonical.children) == 1501
+        assert canonical.compile_evaluator() is not None
+        assert condition.description.count(" OR ") == 1500
+        files = [f for f in sample_files.rglob("*") if f.is_file() and condition.evaluate(f)]
+        assert [f.name for f in files] == ["deep_file.txt"]
+
+    def test_chaining_is_left_associative(self, sample_files):
+        """Test that a.AND(b).OR(c) means (a AND b) OR c."""
+        condition = (
+            Condition.extension(".txt")
+            .AND(Condition.size_between(50, 150))
+            .OR(Condition.extension(".py"))
+        )
+        files = [f for f in sample_files.rglob("*") if f.is_file() and condition.evaluate(f)]
+        assert {f.name for f in files} == {"file1.txt", "deep_file.txt", "file2.py"}
+
+
+class TestConditionStatSharing:
+    """Test that chained predicates share a single stat call per file."""
+
+    class CountingEntry:
+        """Minimal DirEntry stand-in that counts stat calls."""
+
+        def __init__(self, path):
+            self._path = path
+            self.path = str(path)
+            self.name = path.name
+            self.stat_calls = 0
+
+        def stat(self, follow_symlinks=True):
+            self.stat_calls += 1
+            return self._path.stat()
+
+    def test_size_and_time_share_stat(self, sample_files):
+        """Test that size and time predicates stat the file only once."""
+        path = sample_files / "file1.txt"
+        entry = self.CountingEntry(path)
+        condition = Condition.size_greater_than(10).AND(Condition.modified_within_days(1))
+        assert condition.evaluate(path, entry)
+        assert entry.stat_calls == 1
+
+    def test_path_fallback_shares_stat(self, sample_files, monkeypatch):
+        """Test that predicates share one stat when evaluated without a DirEntry."""
+        calls = []
+        real_stat = Path.stat
+
+        def counting_stat(self, *, follow_symlinks=True):
+            calls.append(self)
+            return real_stat(self, follow_symlinks=follow_symlinks)
+
+        monkeypatch.setattr(Path, "stat", counting_stat)
+        path = sample_files / "file1.txt"
+        condition = Condition.size_between(10, 1000).AND(Condition.created_within_days(1))
+        assert condition.evaluate(path)
+        assert calls == [path]
+
+    def test_rejected_by_name_skips_stat(self, sample_files):
+        """Test that a failing name predicate short-circuits before stat."""
+        path = sample_files / "file1.txt"
+        entry = self.CountingEntry(path)
+        condition = Condition.extension(".xyz").AND(Condition.size_greater_than(10))
+        assert not condition.evaluate(path, entry)
+        assert entry.stat_calls == 0
+
+    def test_cheap_predicates_first_without_finalize(self, sample_files):
+        """Test that a freshly combined condition already checks names before stat."""
+        path = sample_files / "file1.txt"
+        entry = self.CountingEntry(path)
+        condition = Condition.modified_within_days(1).AND(Condition.extension(".xyz"))
+        assert not condition.evaluate(path, entry)
+        assert entry.stat_calls == 0
+
+    def test_finalize_runs_cheap_predicates_first(self, sample_files):
+        """Test that finalize moves name predicates ahead of stat predicates."""
+        path = sample_files / "file1.txt"
+        entry = self.CountingEntry(path)
+        condition = Condition.size_greater_than(10).AND(Condition.extension(".xyz")).finalize()
+        assert not condition.evaluate(path, entry)
+        assert entry.stat_calls == 0
+
+    def test_finalize_preserve_order(self, sample_files):
+        """Test that preserve_order keeps operands in written order."""
+        path = sample_files / "file1.txt"
+        entry = self.CountingEntry(path)
+        condition = Condition.size_greater_than(10).AND(Condition.extension(".xyz"))
+        condition.finalize(preserve_order=True)
+        assert not condition.evaluate(path, entry)
+        assert entry.stat_calls == 1
+
+    def test_or_stops_at_first_match(self, sample_files):
+        """Test that an OR returns as soon as one operand matches."""
+        calls = []
+        custom = Condition(lambda path, entry: calls.append(path) or True, "custom")
+        condition = custom.OR(Condition.extension(".txt")).finalize()
+        assert condition.evaluate(sample_files / "file1.txt")
+        assert calls == []
+        assert condition.evaluate(sample_files / "image.png")
+        assert calls == [sample_files / "image.png"]
+
+    def test_compiled_evaluator_matches_tree(self, sample_files):
+        """Test that the generated evaluator agrees with node-by-node evaluation."""
+        condition = (
+            Condition.extension(".txt")
+            .AND(Condition.size_less_than(200).OR(Condition.name_contains("deep")))
+            .OR(Condition.is_image().AND(Condition.size_greater_than(10)))
+        )
+        condition.finalize()
+        evaluate = condition.compile_evaluator()
+        assert condition.compile_evaluator() is evaluate
+        for path in sample_files.rglob("*"):
+            if path.is_file():
+                ctx = core._CandidateCtx(None, False, path)
+                assert evaluate(ctx) == condition.evaluate(path)
+
+    def test_search_uses_one_compiled_evaluator(self, sample_files, monkeypatch):
+        """Test that a search compiles the tree once and evaluates files through it alone."""
+        compiled = []
+        real_compile = Condition.compile_evaluator
+
+        def recording_compile(self):
+            evaluate = real_compile(self)
+            compiled.append(evaluate)
+            return evaluate
+
+        monkeypatch.setattr(Condition, "compile_evaluator", recording_compile)
+        condition = (
+            Condition.is_video()
+            .OR(Condition.is_image())
+            .AND(Condition.size_greater_than(100))
+            .AND(Condition.not_in_directory("subdir3"))
+        )
+        results = FileFinder(root_path=str(sample_files)).search(condition)
+        assert [f.name for f in results] == ["video.mp4"]
+        assert len(compiled) == 1
+        assert compiled[0].__name__ == "evaluate"
+
+    def test_compiled_evaluator_falls_back_for_deep_trees(self, sample_files):
+        """Test that trees nested beyond the compiler's limits still evaluate."""
+        condition = Condition.extension(".txt")
+        for i in range(300):
+            other = Condition.name_contains(f"x{i}")
+            condition = condition.AND(other) if i % 2 else condition.OR(other)
+        condition.finalize()
+        ctx = core._CandidateCtx(None, False, sample_files / "file1.txt")
+        assert condition.compile_evaluator()(ctx) == condition.evaluate(sample_files / "file1.txt")
+
+    def test_compiled_evaluator_falls_back_when_source_too_deep(self):
+        """Test that a tree too deep to emit as source keeps its per-node evaluator."""
+        condition = Condition.extension(".txt")
+        for i in range(1000):
+            other = Condition.name_contains(f"x{i}")
+            condition = condition.AND(other) if i % 2 else condition.OR(other)
+        assert condition.compile_evaluator() is condition._match
+
+
+class TestConditionNameMatcher:
+    """Test the fused name prefilter."""
+
+    def test_extension_and_name_or(self):
+        """Test that OR-ed name leaves fuse into one matcher."""
+        condition = Condition.extension(".py").OR(Condition.name_contains("readme"))
+        matcher = condition.compile_name_matcher()
+        assert matcher("main.PY")
+        assert matcher("README.md")
+        assert not matcher("image.png")
+
+    def test_and_with_stat_predicate_keeps_name_part(self):
+        """Test that AND with a stat predicate still prefilters on the name part."""
+        condition = Condition.extension(".txt").AND(Condition.size_greater_than(10))
+        matcher = condition.compile_name_matcher()
+        assert matcher("notes.txt")
+        assert not matcher("notes.md")
+
+    def test_and_of_name_leaves_requires_all(self):
+        """Test that AND-ed name leaves must all match."""
+        condition = Condition.name_matches(r"^(file|demo)").AND(Condition.extension("txt"))
+        matcher = condition.compile_name_matcher()
+        assert matcher("file1.txt")
+        assert not matcher("file1.py")
+        assert not matcher("other.txt")
+
+    def test_or_with_stat_predicate_has_no_matcher(self):
+        """Test that names alone cannot decide an OR with a size predicate."""
+        condition = Condition.extension(".txt").OR(Condition.size_greater_than(10))
+        assert condition.compile_name_matcher() is None
+
+    def test_non_ascii_case_insensitive_names_found(self, temp_dir):
+        """Test that names whose lower() differs from regex case folding still match."""
+        (temp_dir / "İstanbul.txt").write_text("x")
+        (temp_dir / "notes.İ").write_text("x")
+        finder = FileFinder(root_path=str(temp_dir))
+        for condition, expected in [
+            (Condition.name_equals("İstanbul.txt"), "İstanbul.txt"),
+            (Condition.name_contains("İstanbul"), "İstanbul.txt"),
+            (Condition.name_contains("İstanbul").AND(Condition.size_less_than(10)), "İstanbul.txt"),
+            (Condition.extension(".İ"), "notes.İ"),
+        ]:
+            assert [f.name for f in finder.search(condition)] == [expected]
+
+    def test_backreference_pattern_not_fused(self):
+        """Test that patterns with backreferences are left out of the fused regex."""
+        condition = Condition.name_matches(r"(a)\1")
+        assert condition.compile_name_matcher() is None
+
+    def test_conditional_reference_pattern_not_fused(self):
+        """Test that patterns with conditional group references keep their own groups."""
+        condition = Condition.name_matches(r"(x)").OR(Condition.name_matches(r"(y)?(?(1)z|w)"))
+        matcher = condition.compile_name_matcher()
+        assert matcher is None or matcher("yz")
+        assert condition.evaluate(Path("yz"))
+
+    @pytest.mark.parametrize(
+        ("pattern", "name", "expected"),
+        [
+            (r"^(file|demo).*", "demo.py", True),
+            (r"^(file|demo).*", "my_file.py", False),
+            (r"^(?:a|b)", "beta", True),
+            (r"\Atest", "test_x.py", True),
+            (r"\Atest", "Test_x.py", False),
+        ],
+    )
+    def test_literal_prefix_pattern(self, pattern, name, expected):
+        """Test that literal-prefix patterns are lowered to startswith."""
+        condition = Condition.name_matches(pattern)
+        assert condition.evaluate(Path(name)) is expected
+        assert condition.compile_name_matcher()(name) is expected
+        assert condition._name_test is not None
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"\.py$",
+            r"^(README|LICENSE)$",
+            r"(tmp|temp)",
+            r".*\.txt",
+            r"^a$",
+            r"foo-bar\.txt\Z",
+            r"(a\||b)",
+            r"^(a\|b)",
+        ],
+    )
+    def test_literal_alternation_agrees_with_regex(self, pattern):
+        """Test that lowered suffix, exact and substring patterns match like re.search."""
+        condition = Condition.name_matches(pattern)
+        # An escaped "|" is a literal character, not an alternative separator
+        assert (condition._name_test is not None) is ("\\|" not in pattern)
+        matcher = condition.compile_name_matcher()
+        names = ["main.py", "main.pyc", "README", "README.md", "a", "a\n", "temp.txt"]
+        names += ["mytmp", "foo-bar.txt", "foo-barXtxt", "zzz.txt", "plain", "a|b", "a\\x"]
+        for name in names:
+            expected = re.search(pattern, name) is not None
+            assert condition.evaluate(Path(name)) is expected
+            assert bool(matcher(name)) is expected
+
+    @pytest.mark.parametrize("pattern", [r"^file\d+\.txt$", r"^a.*$", r"(?i)\.py$"])
+    def test_non_literal_pattern_uses_regex(self, pattern):
+        """Test that patterns with metacharacters keep the regex engine."""
+        assert Condition.name_matches(pattern)._name_test is None
+
+    def test_regex_pattern_still_matches(self):
+        """Test that a pattern left to the regex engine matches as before."""
+        condition = Condition.name_matches(r"^file\d+\.txt$")
+        assert condition.evaluate(Path("file12.txt"))
+        assert not condition.evaluate(Path("file.txt"))
+
+
+class TestConditionCanonicalize:
+    """Test the simplification applied to condition trees before a search."""
+
+    def test_flattens_same_operator(self):
+        """Test that chained ANDs become one n-ary node."""
+        condition = (
+            Condition.extension(".py")
+            .AND(Condition.size_greater_than(10))
+            .AND(Condition.modified_within_days(7))
+        )
+        canonical = condition._canonicalize()
+        assert canonical.operator is ConditionOperator.AND
+        assert len(canonical.children) == 3
+
+    def test_dedupes_repeated_leaves(self):
+        """Test that a repeated exclusion is only evaluated once."""
+        condition = (
+            Condition.extension(".py")
+            .AND(Condition.not_in_directory(".git", "venv"))
+            .AND(Condition.not_in_directory("venv", ".git"))
+        )
+        assert len(condition._canonicalize().children) == 2
+
+    def test_merges_or_of_extensions(self):
+        """Test that OR-ed extension leaves collapse into one leaf."""
+        condition = (
+            Condition.extension(".py")
+            .OR(Condition.extension(".md"))
+            .OR(Condition.size_greater_than(10))
+        )
+        canonical = condition._canonicalize()
+        assert len(canonical.children) == 2
+        merged = canonical.children[0]
+        assert merged.operator is None
+        assert merged.evaluate(Path("notes.md"))
+        assert merged.evaluate(Path("main.py"))
+
+    def test_merges_name_contains_by_case_sensitivity(self):
+        """Test that only name_contains leaves with the same case sensitivity merge."""
+        condition = (
+            Condition.name_contains("temp")
+            .OR(Condition.name_contains("TMP"))
+            .OR(Condition.name_contains("Bak", case_sensitive=True))
+        )
+        canonical = condition._canonicalize()
+        assert len(canonical.children) == 2
+        merged = canonical.children[0]
+        assert merged.evaluate(Path("my.tmp.txt"))
+        assert merged.evaluate(Path("TEMPLATE"))
+        assert not canonical.children[1].evaluate(Path("bak.txt"))
+
+    def test_merges_or_of_regex_leaves(self):
+        """Test that OR-ed regex leaves fuse into one alternation per kind."""
+        condition = (
+            Condition.path_matches(r"/build/\d+/")
+            .OR(Condition.path_matches(r"\.cache/"))
+            .OR(Condition.name_matches(r"^test_\w+\.py$"))
+            .OR(Condition.name_matches(r"\d{4}\.log$"))
+        )
+        canonical = condition._canonicalize()
+        assert len(canonical.children) == 2
+        paths, names = canonical.children
+        assert paths.evaluate(Path("/src/build/42/out.o"))
+        assert paths.evaluate(Path("/home/u/.cache/x"))
+        assert not paths.evaluate(Path("/src/build/out.o"))
+        assert names.evaluate(Path("test_core.py"))
+        assert names.evaluate(Path("2024.log"))
+        assert not names.evaluate(Path("core.py"))
+
+    def test_keeps_regex_leaves_that_cannot_fuse(self):
+        """Test that literal, flagged or conflicting regex leaves stay separate."""
+        literal = Condition.name_matches(r"^draft")
+        flagged = Condition.name_matches(r"(?i)readme\.\w+")
+        named = Condition.name_matches(r"(?P<n>\d+)\.txt")
+        same_name = Condition.name_matches(r"(?P<n>\w+)\.md")
+        condition = literal.OR(flagged).OR(named).OR(same_name)
+        assert condition._canonicalize().children == (literal, flagged, named, same_name)
+
+        repeated = Condition.name_matches(r"(x)+")
+        conditional = Condition.name_matches(r"(y)?(?(1)z|w)")
+        condition = repeated.OR(conditional)
+        assert condition._canonicalize().children == (repeated, conditional)
+        assert condition.evaluate(Path("yz"))
+
+    def test_keeps_nested_other_operator(self):
+        """Test that an AND inside an OR is not flattened into the OR."""
+        inner = Condition.extension(".py").AND(Condition.size_less_than(10))
+        condition = inner.OR(Condition.extension(".md"))
+        canonical = condition._canonicalize()
+        assert canonical is condition
+        assert canonical._canonicalize() is canonical
+
+    def test_search_results_unchanged(self, sample_files):
+        """Test that searching the canonical tree finds the same files."""
+        condition = (
+            Condition.extension(".txt")
+            .OR(Condition.extension(".pdf"))
+            .OR(Condition.name_contains("backup").OR(Condition.name_contains("video")))
+            .AND(Condition.size_less_than(1000))
+            .AND(Condition.size_less_than(1000))
+        )
+        finder = FileFinder(root_path=str(sample_files))
+        names = {f.name for f in finder.search(condition)}
+        assert names == {
+            "file1.txt",
+            "file3.txt",
+            "deep_file.txt",
+            "document.pdf",
+            "backup.bak",
+            "video.mp4",
+        }
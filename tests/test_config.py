@@ -1,8 +1,16 @@
 """Tests for configuration module."""
 
+import importlib
 import logging
+from dataclasses import FrozenInstanceError, replace
 
-from file_finder.config import Config, get_logger, setup_logging
+import pytest
+
+from file_finder import Condition, FileFinder, core
+from file_finder.config import Config, config, get_logger, setup_logging
+
+# The package re-exports the config instance under the submodule's name
+config_module = importlib.import_module("file_finder.config")
 
 
 class TestConfig:
@@ -26,6 +34,14 @@ class TestConfig:
         assert config.default_follow_symlinks is True
         assert config.default_max_depth == 5
 
+    def test_from_env_is_frozen(self, monkeypatch):
+        """Test that from_env reads the environment once into an immutable config."""
+        monkeypatch.setenv("FILE_FINDER_LOG_LEVEL", "warning")
+        config = Config.from_env()
+        assert config.numeric_level == logging.WARNING
+        with pytest.raises(FrozenInstanceError):
+            config.log_level = "DEBUG"
+
     def test_config_invalid_int_env(self, monkeypatch):
         """Test handling of invalid integer environment variables."""
         monkeypatch.setenv("FILE_FINDER_MAX_DEPTH", "invalid")
@@ -33,6 +49,20 @@ class TestConfig:
         config = Config()
         assert config.default_max_depth is None
 
+    def test_environment_read_once_per_process(self, tmp_path, monkeypatch):
+        """Test that finders and searches use the global config instead of re-reading env."""
+
+        def rebuild(*args, **kwargs):
+            raise AssertionError("config rebuilt after import")
+
+        # Field defaults read the environment, so any re-read builds a new Config
+        monkeypatch.setattr(Config, "__init__", rebuild)
+        monkeypatch.setattr(Config, "from_env", rebuild)
+        (tmp_path / "a.txt").write_text("a")
+        finder = FileFinder(root_path=str(tmp_path))
+        assert finder.search(Condition.extension(".txt")) == [tmp_path / "a.txt"]
+        assert core.config is config_module.config
+
 
 class TestLogging:
     """Test logging configuration."""
@@ -50,6 +80,22 @@ class TestLogging:
         logger = logging.getLogger("file_finder")
         assert logger.level == logging.DEBUG
 
+    def test_setup_logging_repeated_call_keeps_handlers(self, monkeypatch):
+        """Test that repeating a setup keeps its handlers and a changed one replaces them."""
+        logger = logging.getLogger("file_finder")
+        setup_logging(level="WARNING")
+        handlers = list(logger.handlers)
+        setup_logging(level="WARNING")
+        assert logger.handlers == handlers
+
+        setup_logging(level="ERROR")
+        assert logger.handlers != handlers
+        assert logger.level == logging.ERROR
+
+        monkeypatch.setattr(logger, "handlers", [])
+        setup_logging(level="ERROR")
+        assert len(logger.handlers) == 1
+
     def test_get_logger(self):
         """Test getting a logger instance."""
         logger = get_logger("test")
@@ -61,3 +107,21 @@ class TestLogging:
         setup_logging()
         logger = logging.getLogger("file_finder")
         assert logger.propagate is False
+
+    def test_setup_deferred_until_first_record(self, tmp_path, monkeypatch):
+        """Test that handlers and the log directory are only created once something logs."""
+        logger = logging.getLogger("file_finder")
+        monkeypatch.setattr(logger, "handlers", [])
+        log_file = tmp_path / "logs" / "finder.log"
+        monkeypatch.setattr(config_module, "config", replace(config, log_file=str(log_file)))
+
+        get_logger("deferred")
+        assert not log_file.parent.exists()
+
+        get_logger("deferred").warning("first record")
+        handlers = logger.handlers
+        try:
+            assert log_file.read_text().count("first record") == 1
+        finally:
+            for handler in handlers:
+                handler.close()
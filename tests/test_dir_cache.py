@@ -0,0 +1,125 @@
+"""Tests for the directory listing cache."""
+
+import os
+
+import pytest
+
+from file_finder import Condition, FileFinder
+from file_finder._dir_cache import DirCache, letter_mask
+
+
+class CountingScandir:
+    """os.scandir wrapper that counts directory reads."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        return os.scandir(path)
+
+
+class TestDirCache:
+    """Test DirCache behavior."""
+
+    def test_reuses_unchanged_listing(self, sample_files):
+        """Test that an unchanged directory is read only once."""
+        cache = DirCache(max_size=10)
+        scandir = CountingScandir()
+        with cache.scandir(sample_files, scandir) as entries:
+            first = {entry.name for entry in entries}
+        with cache.scandir(sample_files, scandir) as entries:
+            second = {entry.name for entry in entries}
+        assert first == second
+        assert scandir.calls == 1
+
+    def test_invalidates_when_directory_changes(self, temp_dir):
+        """Test that adding a file invalidates the cached listing."""
+        cache = DirCache(max_size=10)
+        scandir = CountingScandir()
+        (temp_dir / "a.txt").write_text("a")
+        with cache.scandir(temp_dir, scandir) as entries:
+            assert [entry.name for entry in entries] == ["a.txt"]
+
+        (temp_dir / "b.txt").write_text("b")
+        # Force a visible mtime change on filesystems with coarse timestamps
+        stat = temp_dir.stat()
+        os.utime(temp_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        with cache.scandir(temp_dir, scandir) as entries:
+            assert {entry.name for entry in entries} == {"a.txt", "b.txt"}
+        assert scandir.calls == 2
+
+    def test_evicts_least_recently_used(self, sample_files):
+        """Test that the cache never grows beyond max_size."""
+        cache = DirCache(max_size=1)
+        for directory in (sample_files, sample_files / "subdir1"):
+            with cache.scandir(directory):
+                pass
+        assert len(cache) == 1
+
+    def test_cached_entries_stat_fresh(self, temp_dir):
+        """Test that cached entries report current sizes."""
+        cache = DirCache(max_size=10)
+        target = temp_dir / "grow.txt"
+        target.write_text("x")
+        with cache.scandir(temp_dir) as entries:
+            (entry,) = entries
+        target.write_text("x" * 10)
+        assert entry.is_file()
+        assert entry.stat().st_size == 10
+
+
+class TestLetterMask:
+    """Test the letter bitmap used to prefilter cached names."""
+
+    def test_mask_ignores_case_and_non_letters(self):
+        """Test that only ASCII letters count, regardless of case."""
+        assert letter_mask("Ab-1.b") == letter_mask("ab") == 0b11
+        assert letter_mask("123_.") == 0
+
+    def test_substring_mask_is_covered(self):
+        """Test that a name's mask covers the mask of any substring."""
+        name, substring = "my_backup_file.txt", "Backup"
+        assert letter_mask(name) & letter_mask(substring) == letter_mask(substring)
+
+    def test_required_letters_of_tree(self):
+        """Test that AND unions and OR intersects the required letters."""
+        backup = Condition.name_contains("ab")
+        temp = Condition.name_contains("bc")
+        assert backup.AND(temp)._required_letters() == letter_mask("abc")
+        assert backup.OR(temp)._required_letters() == letter_mask("b")
+        assert backup.OR(Condition.size_less_than(10))._required_letters() == 0
+
+
+class TestFileFinderCache:
+    """Test FileFinder with caching enabled."""
+
+    def test_cached_search_matches_uncached(self, sample_files):
+        """Test that repeated cached searches return the same files."""
+        finder = FileFinder(root_path=str(sample_files), cache=True)
+        condition = Condition.extension(".txt").AND(Condition.size_greater_than(80))
+        first = finder.search(condition)
+        second = finder.search(condition)
+        uncached = FileFinder(root_path=str(sample_files), cache=False).search(condition)
+        assert set(first) == set(second) == set(uncached)
+        assert len(first) == 2
+
+    @pytest.mark.parametrize(
+        "condition",
+        [
+            Condition.name_contains("FILE"),
+            Condition.name_contains("demo").OR(Condition.name_contains("deep")),
+            Condition.name_equals("backup.bak"),
+            Condition.name_matches(r"^(video|image)").AND(Condition.extension(".mp4")),
+        ],
+        ids=lambda c: c.description,
+    )
+    def test_letter_prefilter_matches_uncached(self, sample_files, condition):
+        """Test that the letter-mask prefilter never drops a match."""
+        cached = FileFinder(root_path=str(sample_files), cache=True)
+        uncached = FileFinder(root_path=str(sample_files), cache=False)
+        expected = set(uncached.search(condition))
+        assert expected
+        assert set(cached.search(condition)) == expected
+        assert set(cached.search(condition)) == expected
@@ -0,0 +1,127 @@
+"""Tests for the getdents64 directory reader."""
+
+import os
+
+import pytest
+
+from file_finder import Condition, FileFinder, _fastwalk, core
+
+pytestmark = pytest.mark.skipif(not _fastwalk.AVAILABLE, reason="getdents64 not available")
+
+
+class TestRawScandir:
+    """Test the os.scandir-compatible raw reader."""
+
+    def test_lists_same_names_as_scandir(self, sample_files):
+        """Test that every entry reported by os.scandir is returned."""
+        with _fastwalk.scandir(sample_files) as entries:
+            raw_names = {entry.name for entry in entries}
+        with os.scandir(sample_files) as entries:
+            expected = {entry.name for entry in entries}
+        assert raw_names == expected
+
+    def test_entry_types(self, sample_files):
+        """Test that file/dir classification matches os.scandir."""
+        with _fastwalk.scandir(sample_files) as entries:
+            by_name = {entry.name: entry for entry in entries}
+            assert by_name["file1.txt"].is_file()
+            assert not by_name["file1.txt"].is_dir()
+            assert by_name["subdir1"].is_dir()
+            assert not by_name["subdir1"].is_symlink()
+
+    def test_entry_stat_and_path(self, sample_files):
+        """Test stat() and path agree with the filesystem."""
+        with _fastwalk.scandir(sample_files) as entries:
+            entry = next(e for e in entries if e.name == "file2.py")
+            assert entry.path == str(sample_files / "file2.py")
+            assert entry.stat().st_size == 200
+            assert entry.inode() == (sample_files / "file2.py").stat().st_ino
+
+    def test_stat_after_close(self, sample_files):
+        """Test that stat() still works once the directory is closed."""
+        with _fastwalk.scandir(sample_files) as entries:
+            entry = next(e for e in entries if e.name == "file1.txt")
+        assert entry.stat().st_size == 100
+
+    def test_symlink_detection(self, temp_dir):
+        """Test that symlinks are reported from d_type."""
+        target = temp_dir / "target.txt"
+        target.write_text("test")
+        try:
+            (temp_dir / "link.txt").symlink_to(target)
+        except OSError:
+            pytest.skip("Cannot create symlinks on this system")
+
+        with _fastwalk.scandir(temp_dir) as entries:
+            link = next(e for e in entries if e.name == "link.txt")
+            assert link.is_symlink()
+            assert link.is_file()
+            assert not link.is_file(follow_symlinks=False)
+
+    def test_nofollow_refuses_symlinked_directory(self, sample_files, temp_dir):
+        """Test that follow_symlinks=False opens directories with O_NOFOLLOW."""
+        link = temp_dir / "link_dir"
+        try:
+            link.symlink_to(sample_files / "subdir1")
+        except OSError:
+            pytest.skip("Cannot create symlinks on this system")
+
+        with pytest.raises(OSError):
+            _fastwalk.scandir(link, follow_symlinks=False)
+        with _fastwalk.scandir(link) as entries:
+            assert "file3.txt" in {entry.name for entry in entries}
+
+
+class TestSyscallSelection:
+    """Test how the getdents64 syscall number is chosen."""
+
+    @pytest.mark.parametrize(("machine", "pointer_size"), [("x86_64", 4), ("i686", 8)])
+    def test_rejects_mismatched_abi(self, monkeypatch, machine, pointer_size):
+        """Test that a kernel/interpreter word-size mismatch leaves the backend unavailable."""
+        monkeypatch.setattr(_fastwalk.platform, "machine", lambda: machine)
+        monkeypatch.setattr(_fastwalk.struct, "calcsize", lambda fmt: pointer_size)
+        assert _fastwalk._load_syscall() is None
+
+
+class TestGetdentsBackend:
+    """Test FileFinder with the getdents backend."""
+
+    def test_matches_scandir_backend(self, sample_files):
+        """Test that both backends find the same files."""
+        condition = Condition.extension(".txt").OR(Condition.size_greater_than(1024))
+        scandir_results = FileFinder(root_path=str(sample_files)).search(condition)
+        getdents_results = FileFinder(root_path=str(sample_files), backend="getdents").search(
+            condition
+        )
+        assert set(getdents_results) == set(scandir_results)
+        assert len(getdents_results) == 4
+
+    def test_symlinked_root_without_following(self, sample_files, temp_dir):
+        """Test that a symlinked root is still walked when links are not followed."""
+        root = temp_dir / "root_link"
+        try:
+            root.symlink_to(sample_files)
+        except OSError:
+            pytest.skip("Cannot create symlinks on this system")
+
+        finder = FileFinder(root_path=str(root), backend="getdents")
+        results = finder.search(Condition.extension(".txt"))
+        assert {f.name for f in results} == {"file1.txt", "file3.txt", "deep_file.txt"}
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_stats_relative_to_directory_fd(self, sample_files, monkeypatch, workers):
+        """Test that candidates are stat'ed through the open directory descriptor."""
+        monkeypatch.setattr(core, "_PARALLEL_MIN_DIRS", 1)
+        dir_fds = []
+        real_stat = os.stat
+
+        def recording_stat(path, *, dir_fd=None, follow_symlinks=True):
+            dir_fds.append(dir_fd)
+            return real_stat(path, dir_fd=dir_fd, follow_symlinks=follow_symlinks)
+
+        monkeypatch.setattr(_fastwalk.os, "stat", recording_stat)
+        finder = FileFinder(root_path=str(sample_files), backend="getdents", workers=workers)
+        results = finder.search(Condition.size_greater_than(1024))
+        assert [f.name for f in results] == ["large_file.dat"]
+        assert dir_fds
+        assert None not in dir_fds
@@ -4,6 +4,9 @@
 import sys
 from pathlib import Path
 
+# Directory holding this script (the project root), resolved once
+SCRIPT_DIR = Path(__file__).resolve().parent
+
 print("=" * 60)
 print("FileFinder Project Setup Verification")
 print("=" * 60)
@@ -14,7 +17,7 @@ print(f"✓ Python executable: {sys.executable}")
 
 # Check virtual environment
 venv_path = Path(sys.executable).parent.parent
-expected_venv = Path(__file__).parent / ".venv"
+expected_venv = SCRIPT_DIR / ".venv"
 if venv_path.resolve() == expected_venv.resolve():
     print(f"✓ Using correct virtual environment: {venv_path}")
 else:
@@ -43,15 +46,14 @@ try:
     import pytest
     print(f"✓ pytest imported successfully (version {pytest.__version__})")
 except ImportError as e:
-    # Try as module
-    import subprocess
-    result = subprocess.run([sys.executable, "-m", "pytest", "--version"], 
-                          capture_output=True, text=True)
-    if result.returncode == 0:
-        print(f"✓ pytest available as module: {result.stdout.strip()}")
-    else:
-        print(f"✗ Failed to import pytest: {e}")
-        sys.exit(1)
+    # Installed but failing to import is a broken install, not a missing one;
+    # the package metadata tells them apart without starting another interpreter
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        print(f"✗ pytest {version('pytest')} is installed but cannot be imported: {e}")
+    except PackageNotFoundError:
+        print(f"✗ pytest is not installed: {e}")
+    sys.exit(1)
 
 try:
     import ruff
@@ -63,7 +65,7 @@ except ImportError:
 # Test basic functionality
 print("\nTesting FileFinder...")
 try:
-    finder = FileFinder(root_path=str(Path(__file__).parent))
+    finder = FileFinder(root_path=str(SCRIPT_DIR))
     results = finder.search(Condition.extension('.py'), max_results=5)
     print(f"✓ FileFinder works! Found {len(results)} Python files")
 except Exception as e: